@@ -1,19 +1,51 @@
 """Curtaincall: Testing library for terminal applications."""
 
-from importlib.metadata import version as _version
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from curtaincall.expect import expect
 from curtaincall.locator import Locator
-from curtaincall.terminal import Terminal
-from curtaincall.types import CellStyle, CursorPosition
+from curtaincall.types import CellStyle, CursorPosition, ResourceUsage, TerminalMetrics
 
-__version__ = _version("curtaincall")
+if TYPE_CHECKING:
+    from curtaincall.session import CommandResult, ShellSession
+    from curtaincall.terminal import Terminal
 
 __all__ = [
     "CellStyle",
+    "CommandResult",
     "CursorPosition",
     "Locator",
+    "ResourceUsage",
+    "ShellSession",
     "Terminal",
+    "TerminalMetrics",
     "__version__",
     "expect",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access: the pytest plugin imports this package in
+    # every pytest process, and Terminal pulls in pexpect and pyte.
+    if name == "Terminal":
+        from curtaincall.terminal import Terminal
+
+        value: Any = Terminal
+    elif name in ("ShellSession", "CommandResult"):
+        from curtaincall import session
+
+        value = getattr(session, name)
+    elif name == "__version__":
+        from importlib.metadata import version
+
+        value = version("curtaincall")
+    else:
+        raise AttributeError(f"module 'curtaincall' has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
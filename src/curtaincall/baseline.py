@@ -0,0 +1,176 @@
+"""Performance baselines with regression detection across runs."""
+
+from __future__ import annotations
+
+import json
+import statistics
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from curtaincall.types import TerminalMetrics
+
+BASELINE_VERSION = 1
+
+# A value regresses when it exceeds the baseline mean by more than
+# max(tolerance * mean, sigmas * stdev, noise floor).
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_SIGMAS = 3.0
+DEFAULT_MAX_SAMPLES = 20
+
+# Absolute slack per metric so sub-millisecond jitter is never reported.
+_NOISE_FLOOR: dict[str, float] = {
+    "time_to_first_output": 0.005,
+    "input_latency": 0.005,
+    "bytes_read": 0.0,
+    "startup_median": 0.005,
+    "startup_p95": 0.005,
+}
+
+
+def summarize_metrics(metrics: Iterable[TerminalMetrics]) -> dict[str, float]:
+    """Reduce the metrics of every terminal in a test to one value per metric.
+
+    The slowest time-to-first-output and the median input latency are
+    kept; bytes are summed.  Metrics with no measurement are omitted.
+    """
+    first_outputs: list[float] = []
+    latencies: list[float] = []
+    total_bytes = 0
+    for m in metrics:
+        if m.time_to_first_output is not None:
+            first_outputs.append(m.time_to_first_output)
+        latencies.extend(m.input_latencies)
+        total_bytes += m.bytes_read
+
+    values: dict[str, float] = {}
+    if first_outputs:
+        values["time_to_first_output"] = max(first_outputs)
+    if latencies:
+        values["input_latency"] = statistics.median(latencies)
+    if total_bytes:
+        values["bytes_read"] = float(total_bytes)
+    return values
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that exceeded its baseline threshold."""
+
+    test_id: str
+    metric: str
+    value: float
+    baseline: float
+    threshold: float
+
+    def __str__(self) -> str:
+        change = f"{(self.value / self.baseline - 1) * 100:+.0f}%" if self.baseline else "+inf"
+        return (
+            f"{self.test_id}: {self.metric} {self.value:.4g} "
+            f"(baseline {self.baseline:.4g}, threshold {self.threshold:.4g}, {change})"
+        )
+
+
+class Baseline:
+    """Stored per-test metric samples, loaded from and saved to a JSON file.
+
+    Each run's values are compared against the samples loaded at
+    construction time.  On ``save()``, values that did not regress are
+    appended to the stored samples, keeping the newest ``max_samples``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        tolerance: float = DEFAULT_TOLERANCE,
+        sigmas: float = DEFAULT_SIGMAS,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+    ) -> None:
+        self._path = Path(path)
+        self._tolerance = tolerance
+        self._sigmas = sigmas
+        self._max_samples = max_samples
+        self._stored: dict[str, dict[str, list[float]]] = self._load()
+        self._current: dict[str, dict[str, float]] = {}
+
+    def _load(self) -> dict[str, dict[str, list[float]]]:
+        if not self._path.exists():
+            return {}
+        data = json.loads(self._path.read_text())
+        if data.get("version") != BASELINE_VERSION:
+            raise ValueError(
+                f"Unsupported baseline version in {self._path}: {data.get('version')!r}"
+            )
+        return data.get("tests", {})
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, test_id: str, values: dict[str, float]) -> None:
+        """Record this run's metric values for a test."""
+        if values:
+            self._current.setdefault(test_id, {}).update(values)
+
+    def merge(self, current: dict[str, dict[str, float]]) -> None:
+        """Merge values recorded elsewhere (e.g. by an xdist worker)."""
+        for test_id, values in current.items():
+            self.record(test_id, values)
+
+    @property
+    def current(self) -> dict[str, dict[str, float]]:
+        """Values recorded in this run, keyed by test id."""
+        return self._current
+
+    def threshold(self, samples: list[float], metric: str) -> float:
+        """Return the largest value that does not count as a regression."""
+        mean = statistics.fmean(samples)
+        stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+        slack = max(
+            self._tolerance * mean,
+            self._sigmas * stdev,
+            _NOISE_FLOOR.get(metric, 0.0),
+        )
+        return mean + slack
+
+    def regressions(self) -> list[Regression]:
+        """Compare this run's values against the stored samples."""
+        found: list[Regression] = []
+        for test_id, values in sorted(self._current.items()):
+            stored = self._stored.get(test_id, {})
+            for metric, value in sorted(values.items()):
+                samples = stored.get(metric)
+                if not samples:
+                    continue
+                limit = self.threshold(samples, metric)
+                if value > limit:
+                    found.append(
+                        Regression(
+                            test_id=test_id,
+                            metric=metric,
+                            value=value,
+                            baseline=statistics.fmean(samples),
+                            threshold=limit,
+                        )
+                    )
+        return found
+
+    def save(self) -> None:
+        """Append this run's non-regressed values and write the file."""
+        regressed = {(r.test_id, r.metric) for r in self.regressions()}
+        tests = {test_id: dict(metrics) for test_id, metrics in self._stored.items()}
+        for test_id, values in self._current.items():
+            metrics = tests.setdefault(test_id, {})
+            for metric, value in values.items():
+                if (test_id, metric) in regressed:
+                    continue
+                samples = [*metrics.get(metric, []), value]
+                metrics[metric] = samples[-self._max_samples :]
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": BASELINE_VERSION, "tests": tests}
+        self._path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
@@ -0,0 +1,128 @@
+"""Unit tests for performance baselines and regression detection."""
+
+import json
+
+import pytest
+
+from curtaincall.baseline import (
+    BASELINE_VERSION,
+    Baseline,
+    Regression,
+    summarize_metrics,
+)
+from curtaincall.types import TerminalMetrics
+
+
+def _write(path, tests):
+    path.write_text(json.dumps({"version": BASELINE_VERSION, "tests": tests}))
+
+
+def describe_summarize_metrics():
+
+    def it_keeps_slowest_first_output():
+        values = summarize_metrics(
+            [
+                TerminalMetrics(time_to_first_output=0.1),
+                TerminalMetrics(time_to_first_output=0.3),
+            ]
+        )
+        assert values["time_to_first_output"] == 0.3
+
+    def it_takes_median_input_latency():
+        values = summarize_metrics(
+            [
+                TerminalMetrics(input_latencies=(0.01, 0.05)),
+                TerminalMetrics(input_latencies=(0.02,)),
+            ]
+        )
+        assert values["input_latency"] == 0.02
+
+    def it_sums_bytes():
+        values = summarize_metrics([TerminalMetrics(bytes_read=10), TerminalMetrics(bytes_read=5)])
+        assert values["bytes_read"] == 15.0
+
+    def it_omits_unmeasured_metrics():
+        assert summarize_metrics([TerminalMetrics()]) == {}
+
+
+def describe_baseline():
+
+    def it_starts_empty_without_file(tmp_path):
+        baseline = Baseline(tmp_path / "missing.json")
+        baseline.record("t", {"bytes_read": 10.0})
+        assert baseline.regressions() == []
+
+    def it_rejects_unknown_version(tmp_path):
+        path = tmp_path / "b.json"
+        path.write_text(json.dumps({"version": 99, "tests": {}}))
+        with pytest.raises(ValueError, match="Unsupported baseline version"):
+            Baseline(path)
+
+    def it_reports_value_above_tolerance(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"time_to_first_output": [0.1, 0.1, 0.1]}})
+        baseline = Baseline(path, tolerance=0.2)
+        baseline.record("t", {"time_to_first_output": 0.2})
+        [regression] = baseline.regressions()
+        assert regression.metric == "time_to_first_output"
+        assert regression.baseline == pytest.approx(0.1)
+        assert regression.threshold == pytest.approx(0.12)
+
+    def it_accepts_value_within_tolerance(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"time_to_first_output": [0.1, 0.1]}})
+        baseline = Baseline(path, tolerance=0.2)
+        baseline.record("t", {"time_to_first_output": 0.115})
+        assert baseline.regressions() == []
+
+    def it_widens_threshold_for_noisy_samples(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"input_latency": [0.05, 0.15, 0.1]}})
+        baseline = Baseline(path, tolerance=0.0, sigmas=3.0)
+        baseline.record("t", {"input_latency": 0.2})
+        assert baseline.regressions() == []
+
+    def it_ignores_jitter_below_noise_floor(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"time_to_first_output": [0.001]}})
+        baseline = Baseline(path, tolerance=0.0, sigmas=0.0)
+        baseline.record("t", {"time_to_first_output": 0.004})
+        assert baseline.regressions() == []
+
+    def it_saves_new_samples(tmp_path):
+        path = tmp_path / "nested" / "b.json"
+        baseline = Baseline(path)
+        baseline.record("t", {"bytes_read": 100.0})
+        baseline.save()
+        data = json.loads(path.read_text())
+        assert data["version"] == BASELINE_VERSION
+        assert data["tests"]["t"]["bytes_read"] == [100.0]
+
+    def it_does_not_save_regressed_values(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"bytes_read": [100.0]}})
+        baseline = Baseline(path, tolerance=0.1)
+        baseline.record("t", {"bytes_read": 500.0})
+        baseline.save()
+        assert json.loads(path.read_text())["tests"]["t"]["bytes_read"] == [100.0]
+
+    def it_keeps_newest_samples(tmp_path):
+        path = tmp_path / "b.json"
+        _write(path, {"t": {"bytes_read": [1.0, 2.0, 3.0]}})
+        baseline = Baseline(path, tolerance=10.0, max_samples=3)
+        baseline.record("t", {"bytes_read": 4.0})
+        baseline.save()
+        assert json.loads(path.read_text())["tests"]["t"]["bytes_read"] == [2.0, 3.0, 4.0]
+
+    def it_merges_worker_results(tmp_path):
+        baseline = Baseline(tmp_path / "b.json")
+        baseline.merge({"a": {"bytes_read": 1.0}, "b": {"bytes_read": 2.0}})
+        assert set(baseline.current) == {"a", "b"}
+
+
+def describe_regression():
+
+    def it_formats_relative_change():
+        regression = Regression("t", "bytes_read", 150.0, 100.0, 120.0)
+        assert "+50%" in str(regression)
+        assert "bytes_read" in str(regression)
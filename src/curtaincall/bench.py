@@ -0,0 +1,261 @@
+"""CLI startup- and spawn-time benchmarking under a real PTY."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import statistics
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from curtaincall.locator import Locator
+from curtaincall.process import SPAWNERS
+from curtaincall.terminal import Terminal
+
+
+@dataclass(frozen=True)
+class StartupStats:
+    """Summary statistics over repeated startup measurements, in seconds."""
+
+    samples: tuple[float, ...]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def max(self) -> float:
+        return max(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        """95th percentile (nearest-rank)."""
+        ordered = sorted(self.samples)
+        rank = math.ceil(0.95 * len(ordered))
+        return ordered[max(rank, 1) - 1]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "runs": len(self.samples),
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "p95": self.p95,
+            "max": self.max,
+            "stddev": self.stddev,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"runs={len(self.samples)} min={self.min * 1000:.1f}ms "
+            f"median={self.median * 1000:.1f}ms p95={self.p95 * 1000:.1f}ms "
+            f"stddev={self.stddev * 1000:.1f}ms"
+        )
+
+
+def measure_startup(
+    command: str,
+    *,
+    until: str | re.Pattern[str],
+    rows: int = 30,
+    cols: int = 80,
+    env: dict[str, str] | None = None,
+    timeout: float = 10.0,
+    spawner: str = "native",
+) -> float:
+    """Spawn *command* once and return seconds until *until* is on screen.
+
+    The end timestamp is taken on the reader thread when the chunk that
+    completes the match arrives, so polling latency is not included.
+
+    Raises TimeoutError if the text does not appear within *timeout*.
+    """
+    term = Terminal(command, rows=rows, cols=cols, env=env, spawner=spawner)
+    locator = Locator(terminal=term, text=until)
+    matched = threading.Event()
+    matched_at: list[float] = []
+
+    def _on_output(_data: bytes, timestamp: float) -> None:
+        if not matched.is_set() and locator.is_visible():
+            matched_at.append(timestamp)
+            matched.set()
+
+    term.add_output_listener(_on_output)
+    term.start()
+    try:
+        if not matched.wait(timeout):
+            raise TimeoutError(f"{until!r} did not appear within {timeout}s: {command}")
+    finally:
+        term.kill()
+    assert term._started_at is not None
+    return matched_at[0] - term._started_at
+
+
+def startup(  # noqa: PLR0913
+    command: str,
+    *,
+    until: str | re.Pattern[str],
+    runs: int = 50,
+    warmup: int = 5,
+    concurrency: int = 1,
+    rows: int = 30,
+    cols: int = 80,
+    env: dict[str, str] | None = None,
+    timeout: float = 10.0,
+    spawner: str = "native",
+) -> StartupStats:
+    """Benchmark how long *command* takes to reach a screen state.
+
+    Spawns the command ``warmup + runs`` times (up to *concurrency* at
+    once), discards the warmup runs, and returns statistics over the
+    rest.  Each run is measured from spawn until *until* is visible.
+
+    Usage:
+        stats = bench.startup("python -m myapp", until="prompt>", runs=20)
+        assert stats.p95 < 0.5
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+
+    def _run(_: int) -> float:
+        return measure_startup(
+            command,
+            until=until,
+            rows=rows,
+            cols=cols,
+            env=env,
+            timeout=timeout,
+            spawner=spawner,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        list(pool.map(_run, range(warmup)))
+        samples = tuple(pool.map(_run, range(runs)))
+    return StartupStats(samples=samples)
+
+
+def measure_spawn(
+    command: str, *, spawner: str = "native", env: dict[str, str] | None = None
+) -> float:
+    """Start *command* once and return the seconds ``Terminal.start()`` spent spawning it."""
+    term = Terminal(command, env=env, spawner=spawner)
+    term.start()
+    try:
+        spawn_time = term.metrics.spawn_time
+    finally:
+        term.kill()
+    assert spawn_time is not None
+    return spawn_time
+
+
+def spawn(
+    command: str,
+    *,
+    runs: int = 50,
+    warmup: int = 5,
+    spawner: str = "native",
+    env: dict[str, str] | None = None,
+) -> StartupStats:
+    """Benchmark how long *spawner* takes to launch *command* under a PTY.
+
+    Measures PTY setup through the child's ``exec`` (or fork), not the app's own
+    startup; compare spawners with ``spawner="native"``, ``"pexpect"``, and
+    ``"forkserver"``.
+
+    Usage:
+        native = bench.spawn("true", spawner="native")
+        legacy = bench.spawn("true", spawner="pexpect")
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+    for _ in range(warmup):
+        measure_spawn(command, spawner=spawner, env=env)
+    samples = tuple(measure_spawn(command, spawner=spawner, env=env) for _ in range(runs))
+    return StartupStats(samples=samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Console entry point: ``curtaincall-bench {startup,spawn} COMMAND ...``."""
+    parser = argparse.ArgumentParser(
+        prog="curtaincall-bench",
+        description="Benchmark terminal applications under a real PTY.",
+    )
+    commands = parser.add_subparsers(dest="mode", required=True)
+
+    startup_parser = commands.add_parser("startup", help="Measure time until a screen state.")
+    startup_parser.add_argument("command", help="Command to spawn.")
+    startup_parser.add_argument("--until", required=True, help="Text that marks readiness.")
+    startup_parser.add_argument("--regex", action="store_true", help="Treat --until as a regex.")
+    startup_parser.add_argument("--runs", type=int, default=50)
+    startup_parser.add_argument("--warmup", type=int, default=5)
+    startup_parser.add_argument("--concurrency", type=int, default=1)
+    startup_parser.add_argument("--timeout", type=float, default=10.0)
+    startup_parser.add_argument("--spawner", choices=SPAWNERS, default="native")
+    startup_parser.add_argument("--json", action="store_true", help="Print JSON.")
+
+    spawn_parser = commands.add_parser("spawn", help="Compare PTY spawn latency per spawner.")
+    spawn_parser.add_argument("command", help="Command to spawn.")
+    spawn_parser.add_argument("--runs", type=int, default=50)
+    spawn_parser.add_argument("--warmup", type=int, default=5)
+    spawn_parser.add_argument(
+        "--spawner",
+        choices=SPAWNERS,
+        action="append",
+        help="Spawner to measure (repeatable; default: all).",
+    )
+    spawn_parser.add_argument("--json", action="store_true", help="Print JSON.")
+
+    args = parser.parse_args(argv)
+    if args.mode == "spawn":
+        return _main_spawn(args)
+
+    until: str | re.Pattern[str] = re.compile(args.until) if args.regex else args.until
+    try:
+        stats = startup(
+            args.command,
+            until=until,
+            runs=args.runs,
+            warmup=args.warmup,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            spawner=args.spawner,
+        )
+    except TimeoutError as exc:
+        print(f"curtaincall-bench: {exc}", file=sys.stderr)
+        return 1
+
+    print(json.dumps(stats.as_dict()) if args.json else stats)
+    return 0
+
+
+def _main_spawn(args: argparse.Namespace) -> int:
+    results = {
+        name: spawn(args.command, runs=args.runs, warmup=args.warmup, spawner=name)
+        for name in args.spawner or SPAWNERS
+    }
+    if args.json:
+        print(json.dumps({name: stats.as_dict() for name, stats in results.items()}))
+    else:
+        for name, stats in results.items():
+            print(f"{name}: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
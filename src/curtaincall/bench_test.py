@@ -0,0 +1,117 @@
+"""Unit tests for startup benchmarking statistics and CLI."""
+
+import json
+import re
+from unittest.mock import patch
+
+import pytest
+
+from curtaincall.bench import StartupStats, main, spawn, startup
+
+
+def describe_startup_stats():
+
+    def it_computes_summary_statistics():
+        stats = StartupStats(samples=(0.3, 0.1, 0.2))
+        assert stats.min == 0.1
+        assert stats.max == 0.3
+        assert stats.median == 0.2
+        assert stats.mean == pytest.approx(0.2)
+        assert stats.stddev == pytest.approx(0.1)
+
+    def it_computes_nearest_rank_p95():
+        stats = StartupStats(samples=tuple(float(i) for i in range(1, 101)))
+        assert stats.p95 == 95.0
+
+    def it_handles_single_sample():
+        stats = StartupStats(samples=(0.5,))
+        assert stats.p95 == 0.5
+        assert stats.stddev == 0.0
+
+    def it_serializes_to_dict():
+        data = StartupStats(samples=(0.1, 0.2)).as_dict()
+        assert data["runs"] == 2
+        assert set(data) == {"runs", "min", "median", "mean", "p95", "max", "stddev"}
+
+    def it_formats_in_milliseconds():
+        assert "median=150.0ms" in str(StartupStats(samples=(0.1, 0.2)))
+
+
+def describe_startup():
+
+    @patch("curtaincall.bench.measure_startup")
+    def it_discards_warmup_runs(mock_measure):
+        mock_measure.side_effect = [9.0, 9.0, 0.1, 0.2, 0.3]
+        stats = startup("cmd", until="ready", runs=3, warmup=2)
+        assert stats.samples == (0.1, 0.2, 0.3)
+        assert mock_measure.call_count == 5
+
+    @patch("curtaincall.bench.measure_startup", return_value=0.1)
+    def it_passes_options_through(mock_measure):
+        startup("cmd", until="ready", runs=1, warmup=0, rows=10, cols=20, env={"A": "1"})
+        mock_measure.assert_called_once_with(
+            "cmd", until="ready", rows=10, cols=20, env={"A": "1"}, timeout=10.0, spawner="native"
+        )
+
+    def it_rejects_zero_runs():
+        with pytest.raises(ValueError, match="at least 1"):
+            startup("cmd", until="ready", runs=0)
+
+
+def describe_spawn():
+
+    @patch("curtaincall.bench.measure_spawn")
+    def it_discards_warmup_runs(mock_measure):
+        mock_measure.side_effect = [9.0, 0.01, 0.02]
+        stats = spawn("cmd", runs=2, warmup=1, spawner="pexpect")
+        assert stats.samples == (0.01, 0.02)
+        mock_measure.assert_called_with("cmd", spawner="pexpect", env=None)
+
+    def it_rejects_zero_runs():
+        with pytest.raises(ValueError, match="at least 1"):
+            spawn("cmd", runs=0)
+
+
+def describe_main():
+
+    @patch("curtaincall.bench.startup")
+    def it_prints_stats(mock_startup, capsys):
+        mock_startup.return_value = StartupStats(samples=(0.1,))
+        assert main(["startup", "my-cli", "--until", "prompt>", "--runs", "3"]) == 0
+        assert "median=100.0ms" in capsys.readouterr().out
+        assert mock_startup.call_args.kwargs["runs"] == 3
+        assert mock_startup.call_args.kwargs["until"] == "prompt>"
+
+    @patch("curtaincall.bench.startup")
+    def it_prints_json(mock_startup, capsys):
+        mock_startup.return_value = StartupStats(samples=(0.1,))
+        main(["startup", "my-cli", "--until", "x", "--json"])
+        assert json.loads(capsys.readouterr().out)["runs"] == 1
+
+    @patch("curtaincall.bench.startup")
+    def it_compiles_regex(mock_startup):
+        mock_startup.return_value = StartupStats(samples=(0.1,))
+        main(["startup", "my-cli", "--until", r"v\d+", "--regex"])
+        assert isinstance(mock_startup.call_args.kwargs["until"], re.Pattern)
+
+    @patch("curtaincall.bench.startup", side_effect=TimeoutError("never appeared"))
+    def it_reports_timeout(_mock_startup, capsys):
+        assert main(["startup", "my-cli", "--until", "x"]) == 1
+        assert "never appeared" in capsys.readouterr().err
+
+    @patch("curtaincall.bench.spawn")
+    def it_compares_all_spawners_by_default(mock_spawn, capsys):
+        mock_spawn.return_value = StartupStats(samples=(0.002,))
+        assert main(["spawn", "true", "--runs", "2"]) == 0
+        out = capsys.readouterr().out
+        assert "native: runs=1" in out
+        assert "pexpect: runs=1" in out
+        assert "forkserver: runs=1" in out
+        spawners = [c.kwargs["spawner"] for c in mock_spawn.call_args_list]
+        assert spawners == ["native", "pexpect", "forkserver"]
+
+    @patch("curtaincall.bench.spawn")
+    def it_prints_spawn_json_for_selected_spawner(mock_spawn, capsys):
+        mock_spawn.return_value = StartupStats(samples=(0.002,))
+        main(["spawn", "true", "--spawner", "native", "--json"])
+        assert list(json.loads(capsys.readouterr().out)) == ["native"]
@@ -0,0 +1,90 @@
+"""Bounded capture of a child's separate stderr stream."""
+
+from __future__ import annotations
+
+import re
+import threading
+
+import pyte
+
+from curtaincall.locator import Locator
+
+# CSI, OSC, and two-byte escape sequences; stderr is searched as plain text
+_ESCAPE_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-_]")
+
+
+class StreamCapture:
+    """The most recent *max_bytes* of a byte stream, searchable like a screen.
+
+    ``get_by_text()`` returns a ``Locator`` over the captured lines, so
+    the usual assertions work on it:
+
+        expect(term.stderr.get_by_text("Traceback")).not_to_be_visible()
+
+    Escape sequences and carriage returns are stripped before matching.
+    Older output beyond *max_bytes* is discarded; ``dropped`` counts it.
+    """
+
+    def __init__(self, *, max_bytes: int = 1 << 20) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._max_bytes = max_bytes
+        self._data = bytearray()
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def feed(self, data: bytes) -> None:
+        """Append a chunk, discarding the oldest bytes beyond the limit."""
+        with self._lock:
+            self._data += data
+            excess = len(self._data) - self._max_bytes
+            if excess > 0:
+                del self._data[:excess]
+                self._dropped += excess
+
+    @property
+    def bytes(self) -> bytes:
+        """The captured raw bytes."""
+        with self._lock:
+            return bytes(self._data)
+
+    @property
+    def dropped(self) -> int:
+        """Number of bytes discarded to stay within ``max_bytes``."""
+        with self._lock:
+            return self._dropped
+
+    @property
+    def text(self) -> str:
+        """The captured output decoded as UTF-8, without escape sequences."""
+        text = self.bytes.decode("utf-8", errors="replace")
+        return _ESCAPE_RE.sub("", text).replace("\r\n", "\n").replace("\r", "")
+
+    @property
+    def lines(self) -> list[str]:
+        """The captured output split into lines (no trailing empty line)."""
+        return self.text.splitlines()
+
+    def get_by_text(
+        self,
+        text: str | re.Pattern[str],
+        *,
+        full: bool = False,
+    ) -> Locator:
+        """Create a locator that matches text in the captured output."""
+        return Locator(terminal=self, text=text, full=full)
+
+    # -- Screen-like surface used by Locator and expect() --
+
+    def get_buffer(self) -> list[list[str]]:
+        """Captured lines as a ragged 2D list of characters."""
+        return [list(line) for line in self.lines]
+
+    def _get_char_at(self, row: int, col: int) -> pyte.screens.Char:
+        # Captured output carries no styling; report default attributes.
+        lines = self.lines
+        line = lines[row] if row < len(lines) else ""
+        return pyte.screens.Char(line[col] if col < len(line) else " ")
+
+    def _get_screen_text(self) -> str:
+        return self.text.rstrip("\n")
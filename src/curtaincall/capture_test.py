@@ -0,0 +1,62 @@
+"""Unit tests for bounded stderr capture."""
+
+import re
+
+import pytest
+
+from curtaincall import expect
+from curtaincall.capture import StreamCapture
+
+
+def describe_stream_capture():
+
+    def it_starts_empty():
+        capture = StreamCapture()
+        assert capture.bytes == b""
+        assert capture.lines == []
+        assert capture.dropped == 0
+
+    def it_accumulates_chunks_into_lines():
+        capture = StreamCapture()
+        capture.feed(b"first li")
+        capture.feed(b"ne\nsecond\n")
+        assert capture.lines == ["first line", "second"]
+
+    def it_strips_escape_sequences_and_carriage_returns():
+        capture = StreamCapture()
+        capture.feed(b"\x1b[31merror\x1b[0m: bad\r\n\x1b]0;title\x07done\r\n")
+        assert capture.lines == ["error: bad", "done"]
+
+    def it_keeps_only_the_newest_bytes():
+        capture = StreamCapture(max_bytes=8)
+        capture.feed(b"0123456789")
+        assert capture.bytes == b"23456789"
+        assert capture.dropped == 2
+
+    def it_decodes_invalid_utf8_with_replacement():
+        capture = StreamCapture()
+        capture.feed(b"ok \xff\n")
+        assert capture.lines == ["ok �"]
+
+    def it_rejects_nonpositive_limit():
+        with pytest.raises(ValueError, match="at least 1"):
+            StreamCapture(max_bytes=0)
+
+
+def describe_stream_capture_locators():
+
+    def it_finds_text_and_regexes():
+        capture = StreamCapture()
+        capture.feed(b"warning: deprecated\nerror: failed 3 times\n")
+        assert capture.get_by_text("deprecated").is_visible()
+        assert capture.get_by_text(re.compile(r"failed \d+")).text() == "failed 3"
+        assert capture.get_by_text("warning: deprecated", full=True).is_visible()
+        assert not capture.get_by_text("missing").is_visible()
+
+    def it_works_with_expect():
+        capture = StreamCapture()
+        capture.feed(b"boom\n")
+        expect(capture.get_by_text("boom")).to_be_visible(timeout=0.1)
+        expect(capture.get_by_text("boom")).to_have_fg_color("default")
+        with pytest.raises(AssertionError, match="Screen content:\nboom"):
+            expect(capture.get_by_text("nope")).to_be_visible(timeout=0.1)
@@ -179,6 +179,93 @@ class TerminalAssertions:
             screen_fn=self._terminal._get_screen_text,
         )
 
+    def to_use_less_memory_than(self, mb: float) -> None:
+        """Assert the process tree's peak resident memory is below *mb* megabytes.
+
+        Uses the samples collected with ``sample_resources`` when enabled,
+        otherwise samples once now.
+        """
+        usage = self._terminal.resources
+        if usage.peak_rss_mb >= mb:
+            raise AssertionError(
+                f"Expected peak memory below {mb} MB, got {usage.peak_rss_mb:.1f} MB "
+                f"across {usage.peak_processes} process(es)"
+            )
+
+    def to_be_idle_cpu(
+        self,
+        *,
+        max_percent: float = 5.0,
+        window: float = 0.5,
+        timeout: float = 5.0,
+    ) -> None:
+        """Assert the process tree settles below *max_percent* CPU.
+
+        CPU usage is measured over *window*-second windows until one is
+        idle enough or *timeout* expires.  Catches busy-looping while the
+        app waits for input.
+        """
+        from curtaincall.resources import tree_cpu_time
+
+        pid = self._terminal.pid
+        if pid is None:
+            raise RuntimeError("Terminal has not been started")
+
+        def check() -> bool:
+            before = tree_cpu_time(pid)
+            started = time.monotonic()
+            time.sleep(window)
+            used = tree_cpu_time(pid) - before
+            return used / (time.monotonic() - started) * 100 <= max_percent
+
+        _poll(
+            check_fn=check,
+            timeout=timeout,
+            interval=0,
+            failure_message=(
+                f"Expected process to be idle (at most {max_percent}% CPU over {window}s)"
+            ),
+            screen_fn=self._terminal._get_screen_text,
+        )
+
+    def to_redraw_at_most(
+        self,
+        *,
+        bytes: int | None = None,
+        full_clears: int | None = None,
+        settle: float = 0.2,
+        timeout: float = 5.0,
+    ) -> None:
+        """Assert the output since the last input stayed within redraw limits.
+
+        Waits until no output has arrived for *settle* seconds, then
+        checks the counters since the most recent ``write()``.  Requires
+        ``analyze_redraws=True``.
+
+        Usage:
+            term.key_down()
+            expect(term).to_redraw_at_most(bytes=200, full_clears=0)
+        """
+        redraws = self._terminal.redraws
+        _poll(
+            check_fn=lambda: redraws.idle_for() >= settle,
+            timeout=timeout,
+            interval=settle / 4,
+            failure_message=f"Expected output to settle for {settle}s",
+            screen_fn=self._terminal._get_screen_text,
+        )
+
+        stats = redraws.since_input
+        problems = []
+        if bytes is not None and stats.bytes > bytes:
+            problems.append(f"{stats.bytes} bytes > {bytes}")
+        if full_clears is not None and stats.full_clears > full_clears:
+            problems.append(f"{stats.full_clears} full clears > {full_clears}")
+        if problems:
+            raise AssertionError(
+                f"Expected redraw within limits ({', '.join(problems)})\n\nRedraw: {stats}"
+            )
+
     def to_match_snapshot(self) -> str:
         """Return the terminal snapshot for comparison."""
         return self._terminal.to_snapshot()
@@ -1,6 +1,6 @@
 """Unit tests for expect() polling, color matching, and assertion classes."""
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,6 +13,8 @@ from curtaincall.expect import (
     _poll_negative,
     expect,
 )
+from curtaincall.redraw import RedrawStats
+from curtaincall.types import ResourceUsage
 
 
 def describe_normalize_color():
@@ -325,3 +327,66 @@ def describe_expect_function():
     def it_raises_for_invalid_type():
         with pytest.raises(TypeError, match="expect\\(\\) requires"):
             expect("not a locator")  # type: ignore[arg-type]
+
+
+def describe_resource_assertions():
+
+    def it_passes_when_memory_is_below_limit():
+        mock_terminal = MagicMock()
+        mock_terminal.resources = ResourceUsage(peak_rss=10 * 1024 * 1024)
+        TerminalAssertions(mock_terminal).to_use_less_memory_than(20)
+
+    def it_fails_when_memory_exceeds_limit():
+        mock_terminal = MagicMock()
+        mock_terminal.resources = ResourceUsage(peak_rss=30 * 1024 * 1024, peak_processes=2)
+        with pytest.raises(AssertionError, match=r"below 20 MB, got 30\.0 MB"):
+            TerminalAssertions(mock_terminal).to_use_less_memory_than(20)
+
+    @patch("curtaincall.resources.tree_cpu_time", side_effect=[1.0, 1.0])
+    def it_passes_when_cpu_is_idle(_mock_cpu):
+        mock_terminal = MagicMock(pid=1)
+        TerminalAssertions(mock_terminal).to_be_idle_cpu(window=0.01, timeout=1.0)
+
+    @patch("curtaincall.resources.tree_cpu_time")
+    def it_fails_when_cpu_stays_busy(mock_cpu):
+        counter = iter(range(1000))
+        mock_cpu.side_effect = lambda _pid: float(next(counter))
+        mock_terminal = MagicMock(pid=1)
+        mock_terminal._get_screen_text.return_value = ""
+        with pytest.raises(AssertionError, match="Expected process to be idle"):
+            TerminalAssertions(mock_terminal).to_be_idle_cpu(window=0.01, timeout=0.1)
+
+    def it_requires_started_terminal_for_idle_cpu():
+        mock_terminal = MagicMock(pid=None)
+        with pytest.raises(RuntimeError, match="not been started"):
+            TerminalAssertions(mock_terminal).to_be_idle_cpu()
+
+
+def describe_redraw_assertions():
+
+    def _terminal_with(stats):
+        mock_terminal = MagicMock()
+        mock_terminal.redraws.idle_for.return_value = 10.0
+        mock_terminal.redraws.since_input = stats
+        mock_terminal._get_screen_text.return_value = ""
+        return mock_terminal
+
+    def it_passes_within_limits():
+        term = _terminal_with(RedrawStats(bytes=50, full_clears=0))
+        TerminalAssertions(term).to_redraw_at_most(bytes=100, full_clears=0)
+
+    def it_fails_over_byte_limit():
+        term = _terminal_with(RedrawStats(bytes=500))
+        with pytest.raises(AssertionError, match="500 bytes > 100"):
+            TerminalAssertions(term).to_redraw_at_most(bytes=100)
+
+    def it_fails_on_full_clear():
+        term = _terminal_with(RedrawStats(bytes=5, full_clears=1))
+        with pytest.raises(AssertionError, match="1 full clears > 0"):
+            TerminalAssertions(term).to_redraw_at_most(full_clears=0)
+
+    def it_fails_when_output_never_settles():
+        term = _terminal_with(RedrawStats())
+        term.redraws.idle_for.return_value = 0.0
+        with pytest.raises(AssertionError, match="settle"):
+            TerminalAssertions(term).to_redraw_at_most(bytes=1, timeout=0.2)
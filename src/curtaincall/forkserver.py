@@ -0,0 +1,469 @@
+"""Fork server for fast spawning of Python programs under a PTY.
+
+A warm Python process imports the configured modules once, then forks
+for every spawn request.  The fork becomes a session leader with the
+client's PTY as its controlling terminal and runs the target script,
+module, or ``-c`` code as ``__main__``, skipping interpreter startup
+and the preloaded imports.
+
+This module is imported by the server process itself, so it only uses
+the standard library.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import fcntl
+import importlib
+import json
+import os
+import runpy
+import select
+import shlex
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import threading
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+
+from curtaincall.process import PtyProcess, set_winsize
+
+_HEADER = struct.Struct("!I")
+_MAX_FDS = 2
+
+
+@dataclass(frozen=True)
+class PythonTarget:
+    """What a ``python ...`` command line runs: a script, module, or code."""
+
+    kind: str  # "script", "module", or "code"
+    target: str
+    args: tuple[str, ...] = ()
+
+
+def parse_python_command(argv: list[str], python: str) -> PythonTarget | None:
+    """Return the target of *argv* if it runs *python*, else None.
+
+    ``argv[0]`` must already be resolved to a path.  Only ``SCRIPT``,
+    ``-m MODULE``, and ``-c CODE`` are understood; interpreter options
+    (``-u``, ``-X ...``) cannot be applied to a forked process, so
+    commands using them are not eligible.
+    """
+    exe, server = Path(argv[0]), Path(python)
+    if exe.parent != server.parent or os.path.realpath(exe) != os.path.realpath(server):
+        return None
+    if len(argv) == 1:
+        return None  # interactive interpreter
+    first, rest = argv[1], argv[2:]
+    if first in ("-m", "-c"):
+        if not rest:
+            return None
+        kind = "module" if first == "-m" else "code"
+        return PythonTarget(kind=kind, target=rest[0], args=tuple(rest[1:]))
+    if first.startswith("-"):
+        return None
+    return PythonTarget(kind="script", target=first, args=tuple(rest))
+
+
+# -- Client side --
+
+
+class ForkServerProcess(PtyProcess):
+    """A child forked by the fork server, attached to a PTY we own.
+
+    The child is not our child, so its exit status is relayed by the
+    server over the request connection instead of ``waitpid``.
+    """
+
+    spawner = "forkserver"
+
+    def __init__(
+        self,
+        pid: int,
+        fd: int,
+        stderr_fd: int | None,
+        conn: socket.socket,
+        pending: bytes = b"",
+    ) -> None:
+        super().__init__(pid, fd, stderr_fd)
+        self._conn = conn
+        self._conn.setblocking(False)
+        self._pending = pending
+
+    def isalive(self) -> bool:
+        with self._wait_lock:
+            if self._exited:
+                return False
+            self._poll_status()
+            return not self._exited
+
+    def _poll_status(self) -> None:
+        if b"\n" not in self._pending:
+            try:
+                data = self._conn.recv(4096)
+            except BlockingIOError:
+                return
+            except OSError:
+                data = b""
+            if not data:
+                # The server went away without a status; fall back to
+                # checking whether the pid still exists.
+                try:
+                    os.kill(self._pid, 0)
+                except ProcessLookupError:
+                    self._exited = True
+                return
+            self._pending += data
+        while b"\n" in self._pending:
+            line, self._pending = self._pending.split(b"\n", 1)
+            message = json.loads(line)
+            if "status" in message:
+                self._record_status(message["status"])
+
+    def close(self) -> None:
+        super().close()
+        self._conn.close()
+
+
+class ForkServer:
+    """A warm Python process that forks to run Python programs.
+
+    Usage:
+        server = ForkServer(preload=["myapp.cli", "rich"])
+        server.start()
+        child = server.spawn("python -m myapp", env=env, rows=30, cols=80)
+        ...
+        server.stop()
+    """
+
+    def __init__(self, *, preload: tuple[str, ...] = (), python: str = sys.executable) -> None:
+        self.preload = tuple(preload)
+        self.python = python
+        self._process: subprocess.Popen[bytes] | None = None
+        self._dir: str | None = None
+        self._address: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self, *, timeout: float = 30.0) -> None:
+        """Start the server and wait until the preloaded modules are imported.
+
+        Raises RuntimeError if the server fails to start (for example,
+        a preload module cannot be imported).
+        """
+        if self.running:
+            return
+        self._dir = tempfile.mkdtemp(prefix="curtaincall-forkserver-")
+        self._address = str(Path(self._dir) / "sock")
+        code = (
+            "import sys; from curtaincall.forkserver import serve; serve(sys.argv[1], sys.argv[2:])"
+        )
+        self._process = subprocess.Popen(
+            [self.python, "-c", code, self._address, *self.preload],
+            # The server exits when this pipe closes, even if we are killed.
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        assert self._process.stdout is not None
+        ready, _, _ = select.select([self._process.stdout], [], [], timeout)
+        line = self._process.stdout.readline() if ready else b""
+        if line.strip() != b"ready":
+            self._process.kill()
+            _, stderr = self._process.communicate()
+            self._cleanup()
+            raise RuntimeError(f"Fork server failed to start:\n{stderr.decode(errors='replace')}")
+
+    def stop(self) -> None:
+        """Stop the server.  Children already forked keep running."""
+        if self._process is not None:
+            if self._process.poll() is None:
+                assert self._process.stdin is not None
+                self._process.stdin.close()
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5.0)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            for stream in (self._process.stdin, self._process.stdout, self._process.stderr):
+                if stream is not None:
+                    stream.close()
+            self._process = None
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._dir = None
+
+    def target_for(self, command: str, env: dict[str, str]) -> PythonTarget | None:
+        """The Python target of *command*, or None if the server cannot run it."""
+        argv = shlex.split(command)
+        if not argv:
+            return None
+        exe = shutil.which(argv[0], path=env.get("PATH", os.defpath))
+        if exe is None:
+            return None
+        return parse_python_command([exe, *argv[1:]], self.python)
+
+    def spawn(
+        self,
+        target: PythonTarget,
+        *,
+        env: dict[str, str],
+        rows: int,
+        cols: int,
+        stderr: str = "merge",
+    ) -> ForkServerProcess:
+        """Fork the server to run *target* attached to a new PTY."""
+        if not self.running:
+            self.start()
+        assert self._address is not None
+        master, slave = os.openpty()
+        set_winsize(slave, rows, cols)
+        read_end: int | None = None
+        if stderr == "discard":
+            err_fd = os.open(os.devnull, os.O_WRONLY)
+        elif stderr == "capture":
+            read_end, err_fd = os.pipe()
+        else:
+            err_fd = os.dup(slave)
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self._address)
+            payload = json.dumps(
+                {
+                    "kind": target.kind,
+                    "target": target.target,
+                    "args": list(target.args),
+                    "env": env,
+                    "cwd": str(Path.cwd()),
+                }
+            ).encode()
+            socket.send_fds(conn, [_HEADER.pack(len(payload))], [slave, err_fd])
+            conn.sendall(payload)
+            line, pending = _read_line(conn)
+            reply = json.loads(line)
+        except BaseException:
+            conn.close()
+            os.close(master)
+            if read_end is not None:
+                os.close(read_end)
+            raise
+        finally:
+            os.close(slave)
+            os.close(err_fd)
+        if "error" in reply:
+            conn.close()
+            os.close(master)
+            raise RuntimeError(f"Fork server could not spawn: {reply['error']}")
+        return ForkServerProcess(reply["pid"], master, read_end, conn, pending)
+
+
+def _read_line(conn: socket.socket) -> tuple[bytes, bytes]:
+    """Read one newline-terminated message; returns it and any bytes after it."""
+    data = b""
+    while b"\n" not in data:
+        chunk = conn.recv(4096)
+        if not chunk:
+            raise EOFError("Fork server closed the connection")
+        data += chunk
+    line, rest = data.split(b"\n", 1)
+    return line, rest
+
+
+_servers: dict[tuple[str, tuple[str, ...]], ForkServer] = {}
+_servers_lock = threading.Lock()
+_default_preload: tuple[str, ...] = ()
+
+
+def configure(*, preload: tuple[str, ...] | list[str] = ()) -> None:
+    """Set the modules the shared fork server imports before forking."""
+    global _default_preload
+    _default_preload = tuple(preload)
+
+
+def get_server() -> ForkServer:
+    """Return the shared, running fork server for the configured preload."""
+    key = (sys.executable, _default_preload)
+    with _servers_lock:
+        server = _servers.get(key)
+        if server is None:
+            server = ForkServer(preload=_default_preload)
+            _servers[key] = server
+        if not server.running:
+            server.start()
+        return server
+
+
+@atexit.register
+def _stop_servers() -> None:
+    with _servers_lock:
+        for server in _servers.values():
+            server.stop()
+        _servers.clear()
+
+
+# -- Server side --
+
+
+def serve(address: str, preload: list[str]) -> None:
+    """Run the fork server loop (in the server process)."""
+    for module in preload:
+        importlib.import_module(module)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(address)
+    listener.listen(64)
+
+    # Wake the loop when a child exits
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w)
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    children: dict[int, socket.socket] = {}
+    sys.stdout.write("ready\n")
+    sys.stdout.flush()
+
+    while True:
+        ready, _, _ = select.select([listener, wake_r, 0], [], [], 1.0)
+        if 0 in ready and not os.read(0, 4096):
+            return  # the client closed our stdin
+        if wake_r in ready:
+            with contextlib.suppress(BlockingIOError):
+                os.read(wake_r, 4096)
+        if listener in ready:
+            conn, _ = listener.accept()
+            _handle_request(conn, listener, children)
+        _reap(children)
+
+
+def _reap(children: dict[int, socket.socket]) -> None:
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        conn = children.pop(pid, None)
+        if conn is not None:
+            with contextlib.suppress(OSError):
+                conn.sendall(json.dumps({"status": status}).encode() + b"\n")
+            conn.close()
+
+
+def _handle_request(
+    conn: socket.socket, listener: socket.socket, children: dict[int, socket.socket]
+) -> None:
+    try:
+        header, fds, _flags, _addr = socket.recv_fds(conn, _HEADER.size, _MAX_FDS)
+        (length,) = _HEADER.unpack(header)
+        payload = b""
+        while len(payload) < length:
+            chunk = conn.recv(length - len(payload))
+            if not chunk:
+                raise EOFError("Client closed the connection")
+            payload += chunk
+        request = json.loads(payload)
+    except Exception as exc:
+        with contextlib.suppress(OSError):
+            conn.sendall(json.dumps({"error": repr(exc)}).encode() + b"\n")
+        conn.close()
+        return
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the forked child
+        listener.close()
+        conn.close()
+        for other in children.values():
+            other.close()
+        _run_child(request, tty_fd=fds[0], stderr_fd=fds[1])
+    for fd in fds:
+        os.close(fd)
+    children[pid] = conn
+    conn.sendall(json.dumps({"pid": pid}).encode() + b"\n")
+
+
+def _run_child(request: dict, *, tty_fd: int, stderr_fd: int) -> None:  # pragma: no cover
+    """Become the target program: new session, PTY as controlling tty, run __main__."""
+    code = 1
+    try:
+        _attach(tty_fd, stderr_fd)
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        _run_target(request["kind"], request["target"], request["args"])
+        code = 0
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except KeyboardInterrupt:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        os.kill(os.getpid(), signal.SIGINT)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        with contextlib.suppress(BaseException):
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        os._exit(code)
+
+
+def _attach(tty_fd: int, stderr_fd: int) -> None:  # pragma: no cover
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.setsid()
+    fcntl.ioctl(tty_fd, termios.TIOCSCTTY, 0)
+    os.dup2(tty_fd, 0)
+    os.dup2(tty_fd, 1)
+    os.dup2(stderr_fd, 2)
+    os.close(tty_fd)
+    os.close(stderr_fd)
+    # Re-open the standard streams so buffering matches the new fds
+    # (line-buffered on a tty) instead of the server's pipes.
+    sys.stdin = sys.__stdin__ = open(0, closefd=False)  # noqa: SIM115
+    sys.stdout = sys.__stdout__ = open(1, "w", closefd=False)  # noqa: SIM115
+    sys.stderr = sys.__stderr__ = open(  # noqa: SIM115
+        2, "w", buffering=1, errors="backslashreplace", closefd=False
+    )
+
+
+def _run_target(kind: str, target: str, args: list[str]) -> None:  # pragma: no cover
+    """Run *target* as ``__main__`` the way ``python`` would."""
+    if kind == "script":
+        sys.argv = [target, *args]
+        sys.path[0] = str(Path(target).resolve().parent)
+        runpy.run_path(target, run_name="__main__")
+    elif kind == "module":
+        sys.argv = [target, *args]
+        sys.path[0] = str(Path.cwd())
+        runpy.run_module(target, run_name="__main__", alter_sys=True)
+    else:
+        sys.argv = ["-c", *args]
+        sys.path[0] = ""
+        exec(compile(target, "<string>", "exec"), {"__name__": "__main__"})
@@ -0,0 +1,194 @@
+"""Unit tests for the Python fork server."""
+
+import os
+import signal
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from curtaincall import forkserver, process
+from curtaincall.forkserver import ForkServer, ForkServerProcess, PythonTarget, parse_python_command
+from curtaincall.process import PtyProcess
+
+ENV = {"PATH": os.environ.get("PATH", os.defpath), "TERM": "xterm-256color"}
+PYTHON = sys.executable
+
+
+def _read_all(child, timeout: float = 5.0) -> bytes:
+    chunks = []
+    while True:
+        try:
+            data = child.read_nonblocking(4096, timeout=timeout)
+        except EOFError:
+            return b"".join(chunks)
+        if not data:
+            return b"".join(chunks)
+        chunks.append(data)
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ForkServer(preload=("json",))
+    server.start()
+    yield server
+    server.stop()
+
+
+def _run(server: ForkServer, code: str, *args: str, **options) -> ForkServerProcess:
+    target = PythonTarget(kind="code", target=code, args=args)
+    return server.spawn(target, env=ENV, rows=24, cols=80, **options)
+
+
+def describe_parse_python_command():
+
+    def it_parses_scripts():
+        assert parse_python_command([PYTHON, "app.py", "-v"], PYTHON) == PythonTarget(
+            kind="script", target="app.py", args=("-v",)
+        )
+
+    def it_parses_modules():
+        assert parse_python_command([PYTHON, "-m", "http.server", "0"], PYTHON) == PythonTarget(
+            kind="module", target="http.server", args=("0",)
+        )
+
+    def it_parses_code():
+        assert parse_python_command([PYTHON, "-c", "print(1)", "a"], PYTHON) == PythonTarget(
+            kind="code", target="print(1)", args=("a",)
+        )
+
+    def it_rejects_interpreter_options():
+        assert parse_python_command([PYTHON, "-u", "app.py"], PYTHON) is None
+
+    def it_rejects_the_interactive_interpreter():
+        assert parse_python_command([PYTHON], PYTHON) is None
+        assert parse_python_command([PYTHON, "-m"], PYTHON) is None
+
+    def it_rejects_other_executables():
+        assert parse_python_command(["/bin/echo", "app.py"], PYTHON) is None
+
+    def it_rejects_another_environments_interpreter(tmp_path):
+        # Same binary, different environment (e.g. a venv symlink)
+        link = tmp_path / "python"
+        link.symlink_to(PYTHON)
+        assert parse_python_command([str(link), "app.py"], PYTHON) is None
+
+
+def describe_fork_server():
+
+    def it_runs_code_on_a_pty(server):
+        code = "import os, sys; print(os.getsid(0) == os.getpid(), os.isatty(0), sys.argv)"
+        child = _run(server, code, "a", "b")
+        try:
+            output = _read_all(child)
+            assert b"True True ['-c', 'a', 'b']" in output
+        finally:
+            child.close()
+
+    def it_relays_the_exit_status(server):
+        child = _run(server, "import sys; sys.exit(3)")
+        try:
+            assert child._wait_for_exit(5.0)
+            assert child.exitstatus == 3
+        finally:
+            child.close()
+
+    def it_reports_uncaught_exceptions(server):
+        child = _run(server, "raise ValueError('boom')")
+        try:
+            assert b"ValueError: boom" in _read_all(child)
+            assert child._wait_for_exit(5.0)
+            assert child.exitstatus == 1
+        finally:
+            child.close()
+
+    def it_uses_the_requested_environment(server):
+        child = server.spawn(
+            PythonTarget(kind="code", target="import os; print(os.environ['GREETING'])"),
+            env={**ENV, "GREETING": "hi-there"},
+            rows=24,
+            cols=80,
+        )
+        try:
+            assert b"hi-there" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_runs_scripts_as_main(server, tmp_path):
+        script = tmp_path / "app.py"
+        script.write_text("import sys\nif __name__ == '__main__':\n    print('main', sys.argv)\n")
+        child = server.spawn(
+            PythonTarget(kind="script", target=str(script), args=("x",)),
+            env=ENV,
+            rows=24,
+            cols=80,
+        )
+        try:
+            assert f"main ['{script}', 'x']".encode() in _read_all(child)
+        finally:
+            child.close()
+
+    def it_inherits_preloaded_modules(server):
+        child = _run(server, "import sys; print('json' in sys.modules)")
+        try:
+            assert b"True" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_captures_stderr(server):
+        child = _run(server, "import sys; print('oops', file=sys.stderr)", stderr="capture")
+        try:
+            assert child.stderr_fd is not None
+            assert _read_all(child) == b""
+            assert os.read(child.stderr_fd, 4096) == b"oops\n"
+        finally:
+            child.close()
+
+    def it_terminates_running_children(server):
+        child = _run(server, "import time; print('up', flush=True); time.sleep(30)")
+        try:
+            assert b"up" in child.read_nonblocking(4096, timeout=5.0)
+            assert child.terminate(force=True)
+            assert child.signalstatus == signal.SIGHUP
+        finally:
+            child.close()
+
+    def it_raises_when_a_preload_module_fails():
+        broken = ForkServer(preload=("no_such_module_xyz",))
+        with pytest.raises(RuntimeError, match="no_such_module_xyz"):
+            broken.start()
+        assert not broken.running
+
+    def it_removes_its_socket_directory_when_stopped():
+        server = ForkServer()
+        server.start()
+        assert server._dir is not None
+        directory = Path(server._dir)
+        server.stop()
+        assert not server.running
+        assert not directory.exists()
+
+
+def describe_spawn_with_forkserver():
+
+    def it_forks_python_commands(server):
+        with patch.object(forkserver, "get_server", return_value=server):
+            child = process.spawn(
+                f"{PYTHON} -c 'print(42)'", env=ENV, rows=24, cols=80, spawner="forkserver"
+            )
+        try:
+            assert isinstance(child, ForkServerProcess)
+            assert child.spawner == "forkserver"
+            assert b"42" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_falls_back_to_native_for_other_commands(server):
+        with patch.object(forkserver, "get_server", return_value=server):
+            child = process.spawn("echo hi", env=ENV, rows=24, cols=80, spawner="forkserver")
+        try:
+            assert isinstance(child, PtyProcess)
+            assert child.spawner == "native"
+        finally:
+            child.close()
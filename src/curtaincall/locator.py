@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from curtaincall.capture import StreamCapture
     from curtaincall.terminal import Terminal
 
 
@@ -21,29 +22,37 @@ class CellMatch:
 class Locator:
     """Lazy locator that finds text on a terminal screen.
 
-    Created by Terminal.get_by_text(). Doesn't search until properties
-    are accessed or the locator is passed to expect().
+    Created by Terminal.get_by_text() (or ``term.stderr.get_by_text()``).
+    Doesn't search until properties are accessed or the locator is passed
+    to expect().  ``rows`` limits the search to those buffer rows (used
+    by ``CommandResult.get_by_text()``).
     """
 
     def __init__(
         self,
-        terminal: Terminal,
+        terminal: Terminal | StreamCapture,
         text: str | re.Pattern[str],
         *,
         full: bool = False,
+        rows: range | None = None,
     ) -> None:
         self._terminal = terminal
         self._text = text
         self._full = full
+        self._rows = rows
+
+    def _lines(self) -> list[tuple[int, str]]:
+        """Buffer rows to search as ``(row, line)``, limited to ``rows`` if set."""
+        buffer = self._terminal.get_buffer()
+        indices = range(len(buffer)) if self._rows is None else self._rows
+        return [(i, "".join(buffer[i])) for i in indices if 0 <= i < len(buffer)]
 
     @property
     def cells(self) -> list[CellMatch]:
         """Find all matching cell positions on the screen."""
-        buffer = self._terminal.get_buffer()
         matches: list[CellMatch] = []
 
-        for row_idx, row in enumerate(buffer):
-            line = "".join(row)
+        for row_idx, line in self._lines():
             if self._full:
                 self._match_full_line(line, row_idx, matches)
             else:
@@ -85,9 +94,7 @@ class Locator:
     def text(self) -> str:
         """Return the matched text content."""
         if isinstance(self._text, re.Pattern):
-            buffer = self._terminal.get_buffer()
-            for row in buffer:
-                line = "".join(row)
+            for _row_idx, line in self._lines():
                 m = self._text.fullmatch(line.strip()) if self._full else self._text.search(line)
                 if m:
                     return m.group()
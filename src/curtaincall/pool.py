@@ -0,0 +1,151 @@
+"""Pools of terminals spawned and warmed up ahead of demand."""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from curtaincall.locator import Locator
+from curtaincall.terminal import Terminal
+
+ReadyCondition = str | re.Pattern[str] | Callable[[Terminal], bool]
+
+
+class TerminalPool:
+    """Keeps *size* terminals running *command* spawned and ready to use.
+
+    A terminal counts as ready once *ready* holds: text (or a regex) is
+    on screen, or a callable ``ready(term)`` returns True.  Without
+    *ready*, a terminal is ready as soon as it is spawned.  Readiness is
+    checked on the reader thread as output arrives.
+
+    ``acquire()`` hands out a ready terminal (waiting if none is ready
+    yet) and starts a replacement in the background.  Terminals are
+    single-use: the caller owns and kills what it acquires.  *options*
+    are passed to ``Terminal``.
+
+    Usage:
+        pool = TerminalPool("python -m myapp", size=4, ready="prompt>")
+        pool.start()
+        term = pool.acquire()
+        ...
+        term.kill()
+        pool.close()
+    """
+
+    def __init__(
+        self,
+        command: str,
+        *,
+        size: int = 2,
+        ready: ReadyCondition | None = None,
+        ready_timeout: float = 10.0,
+        **options: Any,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._command = command
+        self._size = size
+        self._ready = ready
+        self._ready_timeout = ready_timeout
+        self._options = options
+        # Items are ready terminals, or the error from a failed warm-up.
+        self._idle: queue.Queue[Terminal | BaseException] = queue.Queue()
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of ready terminals waiting to be acquired."""
+        return self._idle.qsize()
+
+    def start(self) -> None:
+        """Begin spawning and warming *size* terminals in the background."""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._size, thread_name_prefix="curtaincall-pool"
+            )
+            for _ in range(self._size):
+                self._executor.submit(self._warm_one)
+
+    def _is_ready(self, term: Terminal) -> bool:
+        if self._ready is None:
+            return True
+        if callable(self._ready) and not isinstance(self._ready, re.Pattern):
+            return self._ready(term)
+        return Locator(terminal=term, text=self._ready).is_visible()
+
+    def _warm_one(self) -> None:
+        """Spawn one terminal and queue it once ready (or queue the failure)."""
+        if self._closed:
+            return
+        term = Terminal(self._command, **self._options)
+        became_ready = threading.Event()
+
+        def _check(_data: bytes, _timestamp: float) -> None:
+            if not became_ready.is_set() and self._is_ready(term):
+                became_ready.set()
+
+        term.add_output_listener(_check)
+        try:
+            term.start()
+            if self._is_ready(term):
+                became_ready.set()
+            if not became_ready.wait(self._ready_timeout):
+                raise TimeoutError(
+                    f"Pooled terminal was not ready within {self._ready_timeout}s: "
+                    f"{self._command}\n\nScreen content:\n{term._get_screen_text()}"
+                )
+        except Exception as exc:
+            term.kill()
+            self._idle.put(exc)
+            return
+        if self._closed:
+            term.kill()
+            return
+        self._idle.put(term)
+
+    def acquire(self, *, timeout: float | None = None) -> Terminal:
+        """Take a ready terminal and start warming its replacement.
+
+        Waits up to *timeout* seconds (default: the ready timeout plus a
+        margin) for one to become ready.  Re-raises the error if the
+        terminal it was waiting for failed to become ready.
+        """
+        if self._closed:
+            raise RuntimeError("Terminal pool is closed")
+        self.start()
+        wait = self._ready_timeout + 5.0 if timeout is None else timeout
+        try:
+            item = self._idle.get(timeout=wait)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled terminal became ready within {wait}s") from None
+        assert self._executor is not None
+        self._executor.submit(self._warm_one)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    def close(self) -> None:
+        """Stop refilling and kill every terminal still in the pool."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, Terminal):
+                item.kill()
@@ -0,0 +1,124 @@
+"""Unit tests for TerminalPool (mocked terminals)."""
+
+import re
+import threading
+from typing import ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from curtaincall.pool import TerminalPool
+
+
+class FakeTerminal:
+    """Stands in for Terminal: prints "ready>" through its listeners on start()."""
+
+    instances: ClassVar[list["FakeTerminal"]] = []
+
+    def __init__(self, command, **options):
+        self.command = command
+        self.options = options
+        self.listeners = []
+        self.screen = ""
+        self.killed = False
+        FakeTerminal.instances.append(self)
+
+    def add_output_listener(self, listener):
+        self.listeners.append(listener)
+
+    def start(self):
+        if self.command == "boom":
+            raise FileNotFoundError("Command not found: 'boom'")
+        self.screen = "ready>" if self.command != "silent" else ""
+        for listener in self.listeners:
+            listener(self.screen.encode(), 0.0)
+
+    def get_buffer(self):
+        return [list(self.screen)]
+
+    def _get_screen_text(self):
+        return self.screen
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_terminal():
+    FakeTerminal.instances = []
+    with patch("curtaincall.pool.Terminal", FakeTerminal):
+        yield
+
+
+def describe_terminal_pool():
+
+    def it_warms_size_terminals_on_start():
+        pool = TerminalPool("app", size=3, ready="ready>")
+        pool.start()
+        term = pool.acquire(timeout=1.0)
+        assert isinstance(term, FakeTerminal)
+        pool.close()
+        assert len(FakeTerminal.instances) >= 3
+
+    def it_refills_after_acquire():
+        pool = TerminalPool("app", size=1)
+        first = pool.acquire(timeout=1.0)
+        second = pool.acquire(timeout=1.0)
+        assert first is not second
+        pool.close()
+
+    def it_passes_options_to_terminal():
+        pool = TerminalPool("app", size=1, rows=10, env={"A": "1"})
+        term = pool.acquire(timeout=1.0)
+        assert term.options == {"rows": 10, "env": {"A": "1"}}
+        pool.close()
+
+    def it_accepts_regex_and_callable_conditions():
+        for ready in (re.compile(r"ready\W"), lambda term: "ready" in term.screen):
+            pool = TerminalPool("app", size=1, ready=ready)
+            assert pool.acquire(timeout=1.0).screen == "ready>"
+            pool.close()
+
+    def it_raises_warmup_timeouts():
+        pool = TerminalPool("silent", size=1, ready="ready>", ready_timeout=0.05)
+        with pytest.raises(TimeoutError, match="not ready within"):
+            pool.acquire(timeout=1.0)
+        pool.close()
+        assert FakeTerminal.instances[0].killed
+
+    def it_raises_spawn_errors():
+        pool = TerminalPool("boom", size=1)
+        with pytest.raises(FileNotFoundError, match="boom"):
+            pool.acquire(timeout=1.0)
+        pool.close()
+
+    def it_kills_idle_terminals_on_close():
+        pool = TerminalPool("app", size=2)
+        pool.start()
+        acquired = pool.acquire(timeout=1.0)
+        pool.close()
+        idle = [t for t in FakeTerminal.instances if t is not acquired]
+        assert idle
+        assert all(t.killed for t in idle)
+        assert not acquired.killed
+
+    def it_rejects_acquire_after_close():
+        pool = TerminalPool("app")
+        pool.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.acquire()
+
+    def it_rejects_empty_pool():
+        with pytest.raises(ValueError, match="at least 1"):
+            TerminalPool("app", size=0)
+
+    def it_times_out_when_nothing_becomes_ready():
+        gate = threading.Event()
+        pool = TerminalPool("app", size=1)
+        with (
+            patch.object(pool, "_warm_one", side_effect=lambda: gate.wait(1.0)),
+            pytest.raises(TimeoutError, match="No pooled terminal"),
+        ):
+            pool.acquire(timeout=0.05)
+        gate.set()
+        pool.close()
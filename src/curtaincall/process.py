@@ -0,0 +1,477 @@
+"""Child processes attached to a pseudo-terminal.
+
+``PtyProcess`` is the default: it opens the PTY itself and launches the
+child with ``posix_spawn`` (a minimal ``fork`` + ``exec`` where
+``posix_spawn`` cannot acquire a controlling terminal), so no Python code
+runs between fork and exec.  ``PexpectProcess`` adapts ``pexpect.spawn``
+to the same interface for comparison and as a fallback.  Python programs
+can also be forked from a warm interpreter (``spawner="forkserver"``, see
+``curtaincall.forkserver``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import fcntl
+import os
+import select
+import shlex
+import shutil
+import signal
+import struct
+import sys
+import termios
+import threading
+import time
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    import pexpect
+
+SPAWNERS = ("native", "pexpect", "forkserver")
+STDERR_MODES = ("merge", "discard", "capture")
+
+# posix_spawn acquires the controlling terminal by opening the tty after
+# setsid(), which is Linux behaviour; BSDs need an explicit TIOCSCTTY.
+_USE_POSIX_SPAWN = sys.platform.startswith("linux") and hasattr(os, "posix_spawn")
+
+
+class ChildProcess(Protocol):
+    """The operations ``Terminal`` needs from a spawned child."""
+
+    spawner: str
+
+    @property
+    def pid(self) -> int: ...
+
+    @property
+    def exitstatus(self) -> int | None: ...
+
+    @property
+    def stderr_fd(self) -> int | None: ...
+
+    def fileno(self) -> int: ...
+
+    def read_nonblocking(self, size: int, timeout: float | None) -> bytes: ...
+
+    def send(self, data: str | bytes) -> int: ...
+
+    def setwinsize(self, rows: int, cols: int) -> None: ...
+
+    def isalive(self) -> bool: ...
+
+    def terminate(self, force: bool = False) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+def set_winsize(fd: int, rows: int, cols: int) -> None:
+    """Set the window size of the terminal behind *fd*."""
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+
+
+def resolve_command(command: str, env: dict[str, str]) -> list[str]:
+    """Split *command* into argv with argv[0] resolved against ``env["PATH"]``.
+
+    Raises FileNotFoundError if the executable cannot be found.
+    """
+    argv = shlex.split(command)
+    if not argv:
+        raise ValueError("Cannot spawn an empty command")
+    path = shutil.which(argv[0], path=env.get("PATH", os.defpath))
+    if path is None:
+        raise FileNotFoundError(f"Command not found: {argv[0]!r}")
+    return [path, *argv[1:]]
+
+
+class PtyProcess:
+    """A child process whose controlling terminal is a fresh PTY.
+
+    The child is a session leader (``setsid``) with the PTY slave as its
+    controlling terminal and as stdin and stdout.  Its stderr is the PTY
+    too (``"merge"``), ``/dev/null`` (``"discard"``), or the write end of
+    a pipe whose read end is ``stderr_fd`` (``"capture"``).  This process
+    keeps only the master side.
+    """
+
+    spawner = "native"
+
+    def __init__(self, pid: int, fd: int, stderr_fd: int | None = None) -> None:
+        self._pid = pid
+        self._fd = fd
+        self._stderr_fd = stderr_fd
+        self._closed = False
+        self._eof = False
+        self._exited = False
+        self._exitstatus: int | None = None
+        self._signalstatus: int | None = None
+        self._wait_lock = threading.Lock()
+
+    @classmethod
+    def spawn(
+        cls,
+        argv: list[str],
+        *,
+        env: dict[str, str],
+        rows: int,
+        cols: int,
+        stderr: str = "merge",
+    ) -> PtyProcess:
+        """Open a PTY of *rows* x *cols* and start *argv* attached to it.
+
+        ``argv[0]`` must be a path to an executable.  *stderr* is one of
+        ``STDERR_MODES``.
+        """
+        if stderr not in STDERR_MODES:
+            raise ValueError(f"Unknown stderr mode {stderr!r}; expected one of {STDERR_MODES}")
+        master, slave = os.openpty()
+        # Pipe fds are non-inheritable; only the dup onto fd 2 survives exec.
+        read_end, write_end = os.pipe() if stderr == "capture" else (None, None)
+        try:
+            set_winsize(slave, rows, cols)
+            if _USE_POSIX_SPAWN:
+                pid = cls._posix_spawn(argv, env, slave, stderr, write_end)
+            else:
+                pid = cls._fork_exec(argv, env, master, slave, stderr, write_end)
+        except BaseException:
+            os.close(master)
+            if read_end is not None:
+                os.close(read_end)
+            raise
+        finally:
+            os.close(slave)
+            if write_end is not None:
+                os.close(write_end)
+        return cls(pid, master, read_end)
+
+    @staticmethod
+    def _posix_spawn(
+        argv: list[str],
+        env: dict[str, str],
+        slave: int,
+        stderr: str,
+        stderr_pipe: int | None,
+    ) -> int:
+        # setsid happens before the file actions, so opening the tty by
+        # name makes it the new session's controlling terminal.  The master
+        # and slave fds are non-inheritable and close on exec.
+        file_actions: list[tuple] = [
+            (os.POSIX_SPAWN_OPEN, 0, os.ttyname(slave), os.O_RDWR, 0),
+            (os.POSIX_SPAWN_DUP2, 0, 1),
+        ]
+        if stderr == "discard":
+            file_actions.append((os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0))
+        elif stderr == "capture":
+            file_actions.append((os.POSIX_SPAWN_DUP2, stderr_pipe, 2))
+        else:
+            file_actions.append((os.POSIX_SPAWN_DUP2, 0, 2))
+        return os.posix_spawn(argv[0], argv, env, file_actions=file_actions, setsid=True)
+
+    @staticmethod
+    def _fork_exec(
+        argv: list[str],
+        env: dict[str, str],
+        master: int,
+        slave: int,
+        stderr: str,
+        stderr_pipe: int | None,
+    ) -> int:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child process
+            try:
+                os.close(master)
+                os.setsid()
+                fcntl.ioctl(slave, termios.TIOCSCTTY, 0)
+                os.dup2(slave, 0)
+                os.dup2(slave, 1)
+                if stderr == "discard":
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), 2)
+                elif stderr == "capture":
+                    os.dup2(stderr_pipe, 2)
+                else:
+                    os.dup2(slave, 2)
+                os.execve(argv[0], argv, env)
+            finally:
+                os._exit(127)
+        return pid
+
+    @property
+    def pid(self) -> int:
+        return self._pid
+
+    @property
+    def exitstatus(self) -> int | None:
+        """Exit code if the child exited normally, else None."""
+        return self._exitstatus
+
+    @property
+    def signalstatus(self) -> int | None:
+        """Signal number if the child was killed by a signal, else None."""
+        return self._signalstatus
+
+    @property
+    def stderr_fd(self) -> int | None:
+        """Read end of the stderr pipe when spawned with ``stderr="capture"``."""
+        return self._stderr_fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def read_nonblocking(self, size: int = 4096, timeout: float | None = 0.05) -> bytes:
+        """Read up to *size* bytes of output.
+
+        Returns ``b""`` if nothing arrives within *timeout* seconds (None
+        blocks).  Raises EOFError once the child has closed the terminal
+        and all output has been read.
+        """
+        if self._eof:
+            raise EOFError("End of file on PTY")
+        if timeout is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return b""
+        try:
+            data = os.read(self._fd, size)
+        except OSError as exc:
+            # Linux reports EIO on the master once the slave side is closed
+            if exc.errno != errno.EIO:
+                raise
+            data = b""
+        if not data:
+            self._eof = True
+            raise EOFError("End of file on PTY")
+        return data
+
+    def send(self, data: str | bytes) -> int:
+        """Write all of *data* (UTF-8 encoded if str) to the terminal."""
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+        view = memoryview(payload)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        return len(payload)
+
+    def setwinsize(self, rows: int, cols: int) -> None:
+        """Resize the terminal; the kernel sends SIGWINCH to the child."""
+        set_winsize(self._fd, rows, cols)
+
+    def _record_status(self, status: int) -> None:
+        self._exited = True
+        if os.WIFEXITED(status):
+            self._exitstatus = os.WEXITSTATUS(status)
+        elif os.WIFSIGNALED(status):
+            self._signalstatus = os.WTERMSIG(status)
+
+    def isalive(self) -> bool:
+        """Whether the child is still running (reaps it if it exited)."""
+        with self._wait_lock:
+            if self._exited:
+                return False
+            try:
+                pid, status = os.waitpid(self._pid, os.WNOHANG)
+            except ChildProcessError:
+                self._exited = True
+                return False
+            if pid == 0:
+                return True
+            self._record_status(status)
+            return False
+
+    def _wait_for_exit(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while self.isalive():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def _signal(self, sig: int) -> None:
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(self._pid, sig)
+
+    def terminate(self, force: bool = False, *, grace: float = 0.1) -> bool:
+        """Stop the child: SIGHUP and SIGINT, then SIGKILL if *force*.
+
+        Each step waits up to *grace* seconds for the child to exit.
+        Returns True if the child is no longer running.
+        """
+        if not self.isalive():
+            return True
+        self._signal(signal.SIGHUP)
+        self._signal(signal.SIGCONT)
+        if self._wait_for_exit(grace):
+            return True
+        self._signal(signal.SIGINT)
+        if self._wait_for_exit(grace):
+            return True
+        if force:
+            self._signal(signal.SIGKILL)
+            return self._wait_for_exit(grace * 10)
+        return False
+
+    def close(self) -> None:
+        """Close the master side (and stderr pipe) and make sure the child is gone."""
+        if not self._closed:
+            self._closed = True
+            os.close(self._fd)
+            if self._stderr_fd is not None:
+                os.close(self._stderr_fd)
+        if self.isalive():
+            self.terminate(force=True)
+
+
+def signal_group(pid: int, sig: int) -> None:
+    """Send *sig* to the process group led by *pid*, ignoring a missing group.
+
+    Every spawner makes the child a session (and so process group)
+    leader, so this reaches the child and anything it started in its
+    foreground group.
+    """
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(pid, sig)
+
+
+def _wait_all(children: list[ChildProcess], timeout: float) -> list[ChildProcess]:
+    """Wait up to *timeout* seconds for *children* to exit; return those still alive."""
+    deadline = time.monotonic() + timeout
+    alive = [child for child in children if child.isalive()]
+    while alive and time.monotonic() < deadline:
+        time.sleep(0.005)
+        alive = [child for child in alive if child.isalive()]
+    return alive
+
+
+def terminate_all(children: list[ChildProcess], *, grace: float = 0.1) -> bool:
+    """Stop *children* together: SIGHUP, then SIGINT, then SIGKILL.
+
+    Each step signals the process group of every child still running
+    and then waits up to *grace* seconds for all of them, so stopping N
+    children costs at most one escalation, not N.  Returns True if every
+    child exited.
+    """
+    alive = [child for child in children if child.isalive()]
+    for sigs, wait in (
+        ((signal.SIGHUP, signal.SIGCONT), grace),
+        ((signal.SIGINT,), grace),
+        ((signal.SIGKILL,), grace * 10),
+    ):
+        if not alive:
+            break
+        for child in alive:
+            for sig in sigs:
+                signal_group(child.pid, sig)
+        alive = _wait_all(alive, wait)
+    return not alive
+
+
+class PexpectProcess:
+    """``pexpect.spawn`` adapted to the ``ChildProcess`` interface.
+
+    pexpect cannot redirect file descriptors, so ``stderr="discard"``
+    wraps the command in ``bash -c '... 2>/dev/null'`` and
+    ``stderr="capture"`` is not supported.
+    """
+
+    spawner = "pexpect"
+
+    def __init__(self, child: pexpect.spawn) -> None:
+        self._child = child
+
+    @classmethod
+    def spawn(
+        cls,
+        command: str,
+        *,
+        env: dict[str, str],
+        rows: int,
+        cols: int,
+        stderr: str = "merge",
+    ) -> PexpectProcess:
+        import pexpect
+
+        if stderr == "capture":
+            raise ValueError('stderr="capture" is not supported by the pexpect spawner')
+        if stderr == "discard":
+            command = f"bash -c {shlex.quote(command + ' 2>/dev/null')}"
+        child = pexpect.spawn(
+            command,
+            dimensions=(rows, cols),
+            env=env,
+            encoding=None,  # binary mode
+        )
+        return cls(child)
+
+    @property
+    def pid(self) -> int:
+        return self._child.pid
+
+    @property
+    def exitstatus(self) -> int | None:
+        return self._child.exitstatus
+
+    @property
+    def stderr_fd(self) -> int | None:
+        return None
+
+    def fileno(self) -> int:
+        return self._child.child_fd
+
+    def read_nonblocking(self, size: int = 4096, timeout: float | None = 0.05) -> bytes:
+        import pexpect
+
+        try:
+            return self._child.read_nonblocking(size, timeout=timeout)
+        except pexpect.TIMEOUT:
+            return b""
+        except pexpect.EOF as exc:
+            raise EOFError(str(exc)) from None
+
+    def send(self, data: str | bytes) -> int:
+        return self._child.send(data)
+
+    def setwinsize(self, rows: int, cols: int) -> None:
+        self._child.setwinsize(rows, cols)
+
+    def isalive(self) -> bool:
+        return self._child.isalive()
+
+    def terminate(self, force: bool = False) -> bool:
+        return self._child.terminate(force=force)
+
+    def close(self) -> None:
+        self._child.close()
+
+
+def spawn(
+    command: str,
+    *,
+    env: dict[str, str],
+    rows: int,
+    cols: int,
+    spawner: str = "native",
+    stderr: str = "merge",
+) -> ChildProcess:
+    """Start *command* (a shell-style command line, not run through a shell).
+
+    *spawner* is ``"native"`` (``PtyProcess``), ``"pexpect"``, or
+    ``"forkserver"``; *stderr* is ``"merge"``, ``"discard"``, or
+    ``"capture"``.  The fork server only runs ``python SCRIPT``,
+    ``python -m MODULE``, and ``python -c CODE`` with its own interpreter;
+    other commands fall back to the native spawner, which the returned
+    child's ``spawner`` attribute reports.
+    """
+    if spawner == "forkserver":
+        from curtaincall import forkserver
+
+        server = forkserver.get_server()
+        target = server.target_for(command, env)
+        if target is not None:
+            return server.spawn(target, env=env, rows=rows, cols=cols, stderr=stderr)
+        spawner = "native"
+    if spawner == "native":
+        argv = resolve_command(command, env)
+        return PtyProcess.spawn(argv, env=env, rows=rows, cols=cols, stderr=stderr)
+    if spawner == "pexpect":
+        return PexpectProcess.spawn(command, env=env, rows=rows, cols=cols, stderr=stderr)
+    raise ValueError(f"Unknown spawner {spawner!r}; expected one of {SPAWNERS}")
@@ -0,0 +1,255 @@
+"""Unit tests for PTY child process spawning."""
+
+import os
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+
+from curtaincall import process
+from curtaincall.process import PexpectProcess, PtyProcess, resolve_command
+
+ENV = {"PATH": os.environ.get("PATH", os.defpath), "TERM": "xterm-256color"}
+
+
+def _spawn(code: str, *, rows: int = 24, cols: int = 80, stderr: str = "merge") -> PtyProcess:
+    argv = [sys.executable, "-c", code]
+    return PtyProcess.spawn(argv, env=ENV, rows=rows, cols=cols, stderr=stderr)
+
+
+def _read_fd(fd: int) -> bytes:
+    chunks = []
+    while chunk := os.read(fd, 4096):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _read_all(child, timeout: float = 5.0) -> bytes:
+    chunks = []
+    while True:
+        try:
+            data = child.read_nonblocking(4096, timeout=timeout)
+        except EOFError:
+            return b"".join(chunks)
+        if not data:
+            return b"".join(chunks)
+        chunks.append(data)
+
+
+def describe_resolve_command():
+
+    def it_splits_and_resolves_executable():
+        argv = resolve_command("sh -c 'echo hi there'", ENV)
+        assert Path(argv[0]).is_absolute()
+        assert argv[1:] == ["-c", "echo hi there"]
+
+    def it_keeps_explicit_paths():
+        assert resolve_command(f"{sys.executable} -V", ENV) == [sys.executable, "-V"]
+
+    def it_raises_for_missing_command():
+        with pytest.raises(FileNotFoundError, match="no-such-command"):
+            resolve_command("no-such-command-xyz", ENV)
+
+    def it_rejects_empty_command():
+        with pytest.raises(ValueError, match="empty"):
+            resolve_command("   ", ENV)
+
+
+def describe_spawn():
+
+    def it_rejects_unknown_spawner():
+        with pytest.raises(ValueError, match="Unknown spawner"):
+            process.spawn("true", env=ENV, rows=24, cols=80, spawner="fork")
+
+    def it_uses_native_spawner_by_default():
+        child = process.spawn("true", env=ENV, rows=24, cols=80)
+        try:
+            assert isinstance(child, PtyProcess)
+        finally:
+            child.close()
+
+    def it_supports_pexpect_spawner():
+        child = process.spawn("true", env=ENV, rows=24, cols=80, spawner="pexpect")
+        try:
+            assert isinstance(child, PexpectProcess)
+        finally:
+            child.close()
+
+
+def describe_pty_process():
+
+    def it_reads_output_until_eof():
+        child = _spawn("print('hello from pty')")
+        try:
+            assert b"hello from pty" in _read_all(child)
+            with pytest.raises(EOFError):
+                child.read_nonblocking(4096, timeout=0.1)
+        finally:
+            child.close()
+
+    def it_returns_empty_bytes_on_timeout():
+        child = _spawn("import time; time.sleep(5)")
+        try:
+            assert child.read_nonblocking(4096, timeout=0.01) == b""
+        finally:
+            child.close()
+
+    def it_runs_child_as_session_leader_with_controlling_tty():
+        code = "import os; print(os.getsid(0) == os.getpid(), os.isatty(0), os.ttyname(0))"
+        child = _spawn(code)
+        try:
+            output = _read_all(child).decode()
+            assert "True True /dev/" in output
+        finally:
+            child.close()
+
+    def it_sets_initial_window_size():
+        child = _spawn("import os; print(os.get_terminal_size(0))", rows=12, cols=34)
+        try:
+            assert b"columns=34, lines=12" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_resizes_window():
+        code = "import os, sys; sys.stdin.readline(); print(os.get_terminal_size(0))"
+        child = _spawn(code)
+        try:
+            child.setwinsize(7, 50)
+            child.send("\n")
+            assert b"columns=50, lines=7" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_sends_input():
+        child = _spawn("print('got', input())")
+        try:
+            assert child.send("abc\n") == 4
+            assert b"got abc" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_records_exit_status():
+        child = _spawn("import sys; sys.exit(3)")
+        _read_all(child)
+        child.close()
+        assert child.isalive() is False
+        assert child.exitstatus == 3
+
+    def it_terminates_running_child():
+        child = _spawn("import time; time.sleep(30)")
+        assert child.isalive() is True
+        assert child.terminate(force=True) is True
+        assert child.isalive() is False
+        assert child.signalstatus == signal.SIGHUP
+        child.close()
+
+    def it_kills_child_that_ignores_signals():
+        code = (
+            "import signal, time\n"
+            "for s in (signal.SIGHUP, signal.SIGINT): signal.signal(s, signal.SIG_IGN)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(30)"
+        )
+        child = _spawn(code)
+        assert b"ready" in child.read_nonblocking(4096, timeout=5.0)
+        assert child.terminate(force=False, grace=0.05) is False
+        assert child.terminate(force=True, grace=0.05) is True
+        assert child.signalstatus == signal.SIGKILL
+        child.close()
+
+    def it_closes_idempotently():
+        child = _spawn("pass")
+        child.close()
+        child.close()
+        assert child.isalive() is False
+
+    def it_does_not_leak_pty_fds_into_child():
+        code = "import os; print(sorted(int(f) for f in os.listdir('/proc/self/fd')))"
+        if not Path("/proc/self/fd").is_dir():
+            pytest.skip("requires /proc")
+        child = _spawn(code)
+        try:
+            # 0-2 are the tty; 3 is listdir's own directory fd
+            assert b"[0, 1, 2, 3]" in _read_all(child)
+        finally:
+            child.close()
+
+
+def describe_pty_process_stderr():
+
+    STDERR_CODE = "import sys; print('out'); print('err', file=sys.stderr); sys.stderr.flush()"
+
+    def it_merges_stderr_into_the_pty_by_default():
+        child = _spawn(STDERR_CODE)
+        try:
+            output = _read_all(child)
+            assert b"out" in output
+            assert b"err" in output
+            assert child.stderr_fd is None
+        finally:
+            child.close()
+
+    def it_discards_stderr():
+        child = _spawn(STDERR_CODE, stderr="discard")
+        try:
+            output = _read_all(child)
+            assert b"out" in output
+            assert b"err" not in output
+        finally:
+            child.close()
+
+    def it_captures_stderr_to_a_pipe():
+        child = _spawn(STDERR_CODE, stderr="capture")
+        try:
+            assert child.stderr_fd is not None
+            assert b"err" not in _read_all(child)
+            assert _read_fd(child.stderr_fd) == b"err\n"
+        finally:
+            child.close()
+
+    def it_keeps_stderr_a_non_tty_when_captured():
+        child = _spawn("import os; print(os.isatty(1), os.isatty(2))", stderr="capture")
+        try:
+            assert b"True False" in _read_all(child)
+        finally:
+            child.close()
+
+    def it_rejects_unknown_stderr_mode():
+        with pytest.raises(ValueError, match="Unknown stderr mode"):
+            _spawn("pass", stderr="pipe")
+
+
+def describe_pexpect_process():
+
+    def it_wraps_command_in_bash_to_discard_stderr():
+        child = PexpectProcess.spawn(
+            "sh -c 'echo out; echo err >&2'", env=ENV, rows=24, cols=80, stderr="discard"
+        )
+        try:
+            output = _read_all(child)
+            assert b"out" in output
+            assert b"err" not in output
+        finally:
+            child.close()
+
+    def it_does_not_support_capture():
+        with pytest.raises(ValueError, match="pexpect spawner"):
+            PexpectProcess.spawn("true", env=ENV, rows=24, cols=80, stderr="capture")
+
+    def it_translates_timeout_and_eof():
+        child = PexpectProcess.spawn(
+            f"{sys.executable} -c \"import sys; sys.stdin.readline(); print('done')\"",
+            env=ENV,
+            rows=24,
+            cols=80,
+        )
+        try:
+            assert child.read_nonblocking(4096, timeout=0.05) == b""
+            child.send("\n")
+            assert b"done" in _read_all(child)
+            with pytest.raises(EOFError):
+                child.read_nonblocking(4096, timeout=0.1)
+        finally:
+            child.close()
+        assert child.exitstatus == 0
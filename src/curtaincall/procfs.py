@@ -0,0 +1,119 @@
+"""Minimal readers for Linux ``/proc`` process information."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+PROC = Path("/proc")
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def is_available() -> bool:
+    """Whether ``/proc`` process information can be read on this system."""
+    return (PROC / "self" / "stat").exists()
+
+
+@dataclass(frozen=True)
+class ProcStat:
+    """Selected fields of ``/proc/<pid>/stat``."""
+
+    pid: int
+    ppid: int
+    pgid: int
+    sid: int
+    state: str
+    cpu_time: float
+    threads: int
+    rss: int
+
+
+def read_stat(pid: int) -> ProcStat | None:
+    """Parse ``/proc/<pid>/stat``; return None if the process is gone."""
+    try:
+        raw = (PROC / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The command name is in parentheses and may itself contain spaces
+    # or parentheses, so split on the last closing parenthesis.
+    fields = raw[raw.rindex(")") + 2 :].split()
+    return ProcStat(
+        pid=pid,
+        state=fields[0],
+        ppid=int(fields[1]),
+        pgid=int(fields[2]),
+        sid=int(fields[3]),
+        cpu_time=(int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        threads=int(fields[17]),
+        rss=int(fields[21]) * _PAGE_SIZE,
+    )
+
+
+def read_peak_rss(pid: int) -> int | None:
+    """Return ``VmHWM`` (peak resident set size) in bytes from ``/proc/<pid>/status``."""
+    try:
+        with (PROC / str(pid) / "status").open() as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def count_fds(pid: int) -> int | None:
+    """Return the number of open file descriptors, or None if unreadable."""
+    try:
+        return sum(1 for _ in (PROC / str(pid) / "fd").iterdir())
+    except OSError:
+        return None
+
+
+def list_pids() -> list[int]:
+    """Return the pids of all visible processes."""
+    return [int(entry.name) for entry in PROC.iterdir() if entry.name.isdigit()]
+
+
+def _children_from_task_files(pid: int) -> list[int] | None:
+    """Read children from ``/proc/<pid>/task/*/children`` (CONFIG_PROC_CHILDREN)."""
+    task_dir = PROC / str(pid) / "task"
+    children: list[int] = []
+    try:
+        threads = list(task_dir.iterdir())
+    except OSError:
+        return []  # process is gone
+    for thread in threads:
+        path = thread / "children"
+        try:
+            children.extend(int(c) for c in path.read_text().split())
+        except FileNotFoundError:
+            if not thread.exists():
+                continue  # thread exited while listing
+            return None
+        except OSError:
+            continue
+    return children
+
+
+def descendants(pid: int) -> list[int]:
+    """Return the pids of all live descendants of *pid* (not including it)."""
+    found: list[int] = []
+    queue = [pid]
+    by_parent: dict[int, list[int]] | None = None
+    while queue:
+        parent = queue.pop()
+        children = _children_from_task_files(parent)
+        if children is None:
+            if by_parent is None:
+                by_parent = {}
+                for other in list_pids():
+                    stat = read_stat(other)
+                    if stat is not None:
+                        by_parent.setdefault(stat.ppid, []).append(other)
+            children = by_parent.get(parent, [])
+        found.extend(children)
+        queue.extend(children)
+    return found
@@ -0,0 +1,85 @@
+"""Unit tests for /proc readers."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from curtaincall import procfs
+
+pytestmark = pytest.mark.skipif(not procfs.is_available(), reason="requires /proc")
+
+
+def describe_read_stat():
+
+    def it_reads_own_process():
+        stat = procfs.read_stat(os.getpid())
+        assert stat is not None
+        assert stat.pid == os.getpid()
+        assert stat.ppid == os.getppid()
+        assert stat.threads >= 1
+        assert stat.rss > 0
+        assert stat.cpu_time > 0
+
+    def it_returns_none_for_missing_process():
+        assert procfs.read_stat(2**22 + 1) is None
+
+    def it_handles_parentheses_in_command_name(tmp_path, monkeypatch):
+        (tmp_path / "42").mkdir()
+        fields = ["S", "1", "42", "42"] + ["0"] * 7 + ["100", "50"] + ["0"] * 4 + ["3"]
+        fields += ["0", "0", "0", "10"]
+        (tmp_path / "42" / "stat").write_text("42 (a) b (c)) " + " ".join(fields))
+        monkeypatch.setattr(procfs, "PROC", tmp_path)
+        stat = procfs.read_stat(42)
+        assert stat.state == "S"
+        assert stat.threads == 3
+        assert stat.cpu_time == pytest.approx(150 / procfs._CLOCK_TICKS)
+
+
+def describe_read_peak_rss():
+
+    def it_reads_high_water_mark():
+        peak = procfs.read_peak_rss(os.getpid())
+        assert peak is not None
+        assert peak >= procfs.read_stat(os.getpid()).rss
+
+    def it_returns_none_for_missing_process():
+        assert procfs.read_peak_rss(2**22 + 1) is None
+
+
+def describe_count_fds():
+
+    def it_counts_open_descriptors():
+        before = procfs.count_fds(os.getpid())
+        r, w = os.pipe()
+        try:
+            assert procfs.count_fds(os.getpid()) == before + 2
+        finally:
+            os.close(r)
+            os.close(w)
+
+    def it_returns_none_for_missing_process():
+        assert procfs.count_fds(2**22 + 1) is None
+
+
+def describe_descendants():
+
+    def it_finds_nested_children():
+        code = "import subprocess, sys; subprocess.run(['sleep', '5'])"
+        proc = subprocess.Popen([sys.executable, "-c", code])
+        try:
+            for _ in range(100):
+                found = procfs.descendants(proc.pid)
+                if found:
+                    break
+                os.sched_yield()
+                subprocess.run(["sleep", "0.02"], check=False)
+            assert len(found) == 1
+            assert procfs.read_stat(found[0]).ppid == proc.pid
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def it_returns_empty_for_missing_process():
+        assert procfs.descendants(2**22 + 1) == []
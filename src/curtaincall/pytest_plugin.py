@@ -2,19 +2,141 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import json
+import re
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from curtaincall.terminal import Terminal
+from curtaincall.baseline import (
+    DEFAULT_SIGMAS,
+    DEFAULT_TOLERANCE,
+    Baseline,
+    summarize_metrics,
+)
+
+# Terminal (and with it pexpect and pyte) is imported only when a fixture
+# creates one, so test sessions that never use curtaincall don't pay for it.
+if TYPE_CHECKING:
+    from curtaincall.bench import StartupStats
+    from curtaincall.pool import TerminalPool
+    from curtaincall.session import ShellSession
+    from curtaincall.terminal import Terminal
+
+_baseline_key = pytest.StashKey[Baseline]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("curtaincall")
+    group.addoption(
+        "--curtaincall-baseline",
+        metavar="path",
+        default=None,
+        help="JSON file of per-test terminal metrics to compare against and update.",
+    )
+    group.addoption(
+        "--curtaincall-baseline-tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        metavar="ratio",
+        help=f"Relative slack over the baseline mean (default: {DEFAULT_TOLERANCE}).",
+    )
+    group.addoption(
+        "--curtaincall-baseline-sigmas",
+        type=float,
+        default=DEFAULT_SIGMAS,
+        metavar="n",
+        help=f"Standard deviations of slack over the baseline mean (default: {DEFAULT_SIGMAS}).",
+    )
+    group.addoption(
+        "--curtaincall-baseline-fail",
+        action="store_true",
+        default=False,
+        help="Fail the session when any metric regresses.",
+    )
+    group.addoption(
+        "--curtaincall-spawner",
+        choices=("native", "pexpect", "forkserver"),
+        default="native",
+        help="Default spawner for the terminal fixture (default: native).",
+    )
+    group.addoption(
+        "--curtaincall-forkserver-preload",
+        metavar="modules",
+        default="",
+        help="Comma-separated modules the fork server imports before forking.",
+    )
+
+
+def _is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    path = config.getoption("curtaincall_baseline", None)
+    if path:
+        config.stash[_baseline_key] = Baseline(
+            path,
+            tolerance=config.getoption("curtaincall_baseline_tolerance"),
+            sigmas=config.getoption("curtaincall_baseline_sigmas"),
+        )
+    preload = config.getoption("curtaincall_forkserver_preload", "")
+    if preload:
+        from curtaincall import forkserver
+
+        forkserver.configure(preload=[m.strip() for m in preload.split(",") if m.strip()])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:  # noqa: ARG001
+    """Collect metrics recorded by an xdist worker (controller side)."""
+    baseline = node.config.stash.get(_baseline_key, None)
+    payload = getattr(node, "workeroutput", {}).get("curtaincall_metrics")
+    if baseline is not None and payload:
+        baseline.merge(json.loads(payload))
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    baseline = config.stash.get(_baseline_key, None)
+    if baseline is None:
+        return
+    if _is_xdist_worker(config):
+        config.workeroutput["curtaincall_metrics"] = json.dumps(baseline.current)
+        return
+    if config.getoption("curtaincall_baseline_fail") and baseline.regressions():
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    baseline.save()
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    baseline = config.stash.get(_baseline_key, None)
+    if baseline is None or _is_xdist_worker(config):
+        return
+    regressions = baseline.regressions()
+    terminalreporter.section("curtaincall baseline")
+    if not regressions:
+        terminalreporter.write_line(
+            f"No regressions against {baseline.path} ({len(baseline.current)} tests measured)"
+        )
+        return
+    for regression in regressions:
+        terminalreporter.write_line(f"REGRESSION {regression}", red=True)
 
 
 def _create_terminal_factory(
     terminals: list[Terminal],
+    *,
+    default_spawner: str = "native",
 ) -> Callable[..., Terminal]:
-    """Create a terminal factory function that tracks created terminals."""
+    """Create a terminal factory function that tracks created terminals.
+
+    ``factory.many(commands, **options)`` starts several terminals
+    concurrently and returns them in order.
+    """
 
-    def _create(
+    def _build(  # noqa: PLR0913
         command: str,
         *,
         rows: int = 30,
@@ -22,37 +144,193 @@ def _create_terminal_factory(
         env: dict[str, str] | None = None,
         history: int = 1000,
         suppress_stderr: bool = False,
+        sample_resources: float | None = None,
+        analyze_redraws: bool = False,
+        spawner: str | None = None,
+        stderr: str | None = None,
     ) -> Terminal:
-        term = Terminal(
+        from curtaincall.terminal import Terminal
+
+        return Terminal(
             command,
             rows=rows,
             cols=cols,
             env=env,
             history=history,
             suppress_stderr=suppress_stderr,
+            sample_resources=sample_resources,
+            analyze_redraws=analyze_redraws,
+            spawner=spawner or default_spawner,
+            stderr=stderr,
         )
+
+    def _create(command: str, **options: Any) -> Terminal:
+        term = _build(command, **options)
         term.start()
         terminals.append(term)
         return term
 
+    def _many(commands: Iterable[str], **options: Any) -> list[Terminal]:
+        from curtaincall.terminal import start_all
+
+        batch = [_build(command, **options) for command in commands]
+        start_all(batch)
+        terminals.extend(batch)
+        return batch
+
+    _create.many = _many  # type: ignore[attr-defined]
     return _create
 
 
+def _kill_terminals(terminals: list[Terminal]) -> None:
+    if terminals:
+        from curtaincall.terminal import kill_all
+
+        kill_all(terminals)
+
+
 @pytest.fixture
-def terminal():
+def terminal(request: pytest.FixtureRequest):
     """Terminal session factory.
 
     Creates isolated PTY sessions. All terminals are automatically
-    cleaned up after the test completes.
+    cleaned up (concurrently) after the test completes.
 
     Usage:
         def test_something(terminal):
             term = terminal("python my_cli.py")
             # ... test interactions ...
+
+        def test_client_server(terminal):
+            server, client = terminal.many(["my-server", "my-client"])
     """
     terminals: list[Terminal] = []
+    spawner = request.config.getoption("curtaincall_spawner", "native")
+
+    yield _create_terminal_factory(terminals, default_spawner=spawner)
+
+    _kill_terminals(terminals)
+
+    baseline = request.config.stash.get(_baseline_key, None)
+    if baseline is not None:
+        baseline.record(request.node.nodeid, summarize_metrics(t.metrics for t in terminals))
+
+
+@pytest.fixture(scope="session")
+def _curtaincall_pools():
+    """Session-wide registry of terminal pools, closed at session end."""
+    pools: dict[tuple[Any, ...], TerminalPool] = {}
+    yield pools
+    for pool in pools.values():
+        pool.close()
+
+
+@pytest.fixture
+def terminal_pool(request: pytest.FixtureRequest, _curtaincall_pools):
+    """Pre-warmed terminal factory.
+
+    ``terminal_pool(command, size=2, ready=None, **options)`` hands out a
+    terminal from a session-wide pool that keeps *size* terminals for
+    that command spawned and ready (*ready* is text, a regex, or a
+    ``callable(term) -> bool``).  A replacement is warmed in the
+    background each time one is taken, so later tests start warm.
+    Terminals are killed after the test like the ``terminal`` fixture's.
+
+    Usage:
+        def test_menu(terminal_pool):
+            term = terminal_pool("python -m myapp", size=4, ready="prompt>")
+            term.submit("help")
+    """
+    terminals: list[Terminal] = []
+
+    def _acquire(
+        command: str,
+        *,
+        size: int = 2,
+        ready: Any = None,
+        ready_timeout: float = 10.0,
+        **options: Any,
+    ) -> Terminal:
+        from curtaincall.pool import TerminalPool
+
+        key = (command, size, repr(ready), ready_timeout, repr(sorted(options.items())))
+        pool = _curtaincall_pools.get(key)
+        if pool is None:
+            pool = TerminalPool(
+                command, size=size, ready=ready, ready_timeout=ready_timeout, **options
+            )
+            pool.start()
+            _curtaincall_pools[key] = pool
+        term = pool.acquire()
+        terminals.append(term)
+        return term
+
+    yield _acquire
+
+    _kill_terminals(terminals)
+
+    baseline = request.config.stash.get(_baseline_key, None)
+    if baseline is not None:
+        baseline.record(request.node.nodeid, summarize_metrics(t.metrics for t in terminals))
+
+
+@pytest.fixture
+def shell_session():
+    """Persistent shell factory for running many commands in one PTY.
+
+    Each call starts a ``ShellSession`` (bash by default, or zsh); all
+    sessions are killed after the test.
+
+    Usage:
+        def test_commands(shell_session):
+            shell = shell_session()
+            assert shell.run("my-cli --version").exit_code == 0
+            result = shell.run("my-cli list")
+            expect(result.get_by_text("item-1")).to_be_visible()
+    """
+    sessions: list[ShellSession] = []
+
+    def _create(shell: str = "bash", **options: Any) -> ShellSession:
+        from curtaincall.session import ShellSession
+
+        session = ShellSession(shell, **options)
+        session.start()
+        sessions.append(session)
+        return session
+
+    yield _create
+
+    _kill_terminals(sessions)
+
+
+@pytest.fixture
+def startup_bench(request: pytest.FixtureRequest):
+    """Startup-time benchmark runner wrapping ``curtaincall.bench.startup``.
+
+    When ``--curtaincall-baseline`` is enabled, the median and p95 are
+    recorded as ``startup_median`` / ``startup_p95`` for the test.
+
+    Usage:
+        def test_startup(startup_bench):
+            stats = startup_bench("python -m myapp", until="prompt>", runs=20)
+            assert stats.median < 0.3
+    """
+
+    def _bench(
+        command: str,
+        *,
+        until: str | re.Pattern[str],
+        **options: Any,
+    ) -> StartupStats:
+        from curtaincall import bench
 
-    yield _create_terminal_factory(terminals)
+        stats = bench.startup(command, until=until, **options)
+        baseline = request.config.stash.get(_baseline_key, None)
+        if baseline is not None:
+            baseline.record(
+                request.node.nodeid,
+                {"startup_median": stats.median, "startup_p95": stats.p95},
+            )
+        return stats
 
-    for t in terminals:
-        t.kill()
+    return _bench
@@ -1,5 +1,7 @@
 """Unit tests for pytest plugin fixture."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 from curtaincall.pytest_plugin import _create_terminal_factory
@@ -7,7 +9,7 @@ from curtaincall.pytest_plugin import _create_terminal_factory
 
 def describe_terminal_factory():
 
-    @patch("curtaincall.pytest_plugin.Terminal")
+    @patch("curtaincall.terminal.Terminal")
     def it_creates_terminal_with_defaults(MockTerminal):
         mock_term = MagicMock()
         MockTerminal.return_value = mock_term
@@ -23,12 +25,16 @@ def describe_terminal_factory():
             env=None,
             history=1000,
             suppress_stderr=False,
+            sample_resources=None,
+            analyze_redraws=False,
+            spawner="native",
+            stderr=None,
         )
         mock_term.start.assert_called_once()
         assert result is mock_term
         assert terminals == [mock_term]
 
-    @patch("curtaincall.pytest_plugin.Terminal")
+    @patch("curtaincall.terminal.Terminal")
     def it_passes_custom_args(MockTerminal):
         mock_term = MagicMock()
         MockTerminal.return_value = mock_term
@@ -44,9 +50,22 @@ def describe_terminal_factory():
             env={"A": "B"},
             history=1000,
             suppress_stderr=False,
+            sample_resources=None,
+            analyze_redraws=False,
+            spawner="native",
+            stderr=None,
         )
 
-    @patch("curtaincall.pytest_plugin.Terminal")
+    @patch("curtaincall.terminal.Terminal")
+    def it_uses_the_configured_default_spawner(MockTerminal):
+        factory = _create_terminal_factory([], default_spawner="forkserver")
+        factory("cmd")
+        factory("cmd", spawner="pexpect")
+
+        spawners = [c.kwargs["spawner"] for c in MockTerminal.call_args_list]
+        assert spawners == ["forkserver", "pexpect"]
+
+    @patch("curtaincall.terminal.Terminal")
     def it_tracks_multiple_terminals(MockTerminal):
         terms = [MagicMock(), MagicMock(), MagicMock()]
         MockTerminal.side_effect = terms
@@ -66,3 +85,46 @@ def describe_terminal_factory():
         factory = _create_terminal_factory(terminals)
         assert callable(factory)
         assert terminals == []
+
+
+def _import_profile(code: str) -> dict[str, int]:
+    """Run *code* in a fresh interpreter and return {module: self-time in us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, module = line.removeprefix("import time:").split("|")
+        profile[module.strip()] = int(self_us)
+    return profile
+
+
+def describe_import_cost():
+
+    def it_does_not_import_pexpect_or_pyte_when_loading_plugin():
+        profile = _import_profile("import pytest; import curtaincall.pytest_plugin")
+        assert "curtaincall.pytest_plugin" in profile
+        for heavy in ("pexpect", "ptyprocess", "pyte", "curtaincall.terminal"):
+            assert heavy not in profile
+
+    def it_does_not_import_pexpect_or_pyte_for_expect_import():
+        profile = _import_profile("from curtaincall import expect")
+        assert "pexpect" not in profile
+        assert "pyte" not in profile
+
+    def it_imports_terminal_on_first_access():
+        profile = _import_profile("import curtaincall; curtaincall.Terminal")
+        assert "pyte" in profile
+        # The native spawner does not need pexpect at all
+        assert "pexpect" not in profile
+
+    def it_keeps_plugin_import_cheap():
+        # Generous budget: the plugin's own modules take a few ms locally.
+        profile = _import_profile("import pytest; import curtaincall.pytest_plugin")
+        own = sum(us for module, us in profile.items() if module.startswith("curtaincall"))
+        assert own < 50_000, f"curtaincall modules took {own}us to import"
@@ -0,0 +1,247 @@
+"""Redraw efficiency analysis from the escape sequences an app emits."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import pyte
+
+# pyte events grouped into the categories we report on
+_CURSOR_EVENTS = frozenset(
+    {
+        "cursor_position",
+        "cursor_up",
+        "cursor_down",
+        "cursor_forward",
+        "cursor_back",
+        "cursor_up1",
+        "cursor_down1",
+        "cursor_to_column",
+        "cursor_to_line",
+        "save_cursor",
+        "restore_cursor",
+    }
+)
+_PARTIAL_CLEAR_EVENTS = frozenset({"erase_in_line", "erase_characters", "delete_characters"})
+_SCROLL_EVENTS = frozenset({"index", "reverse_index", "insert_lines", "delete_lines"})
+
+
+@dataclass(frozen=True)
+class RedrawStats:
+    """Counters describing how an application redraws the screen.
+
+    ``full_clears`` counts erase-display-all (``CSI 2J``/``3J``, or
+    ``CSI J`` from the home position) and terminal resets;
+    ``partial_clears`` counts the remaining display, line, and character
+    erases.  ``redundant_sgr`` counts SGR sequences that left the
+    current attributes unchanged.
+    """
+
+    bytes: int = 0
+    frames: int = 0
+    chars_drawn: int = 0
+    full_clears: int = 0
+    partial_clears: int = 0
+    cursor_moves: int = 0
+    scrolls: int = 0
+    sgr: int = 0
+    sgr_resets: int = 0
+    redundant_sgr: int = 0
+    events: dict[str, int] = field(default_factory=dict)
+
+    def __sub__(self, other: RedrawStats) -> RedrawStats:
+        events = Counter(self.events)
+        events.subtract(other.events)
+        return RedrawStats(
+            bytes=self.bytes - other.bytes,
+            frames=self.frames - other.frames,
+            chars_drawn=self.chars_drawn - other.chars_drawn,
+            full_clears=self.full_clears - other.full_clears,
+            partial_clears=self.partial_clears - other.partial_clears,
+            cursor_moves=self.cursor_moves - other.cursor_moves,
+            scrolls=self.scrolls - other.scrolls,
+            sgr=self.sgr - other.sgr,
+            sgr_resets=self.sgr_resets - other.sgr_resets,
+            redundant_sgr=self.redundant_sgr - other.redundant_sgr,
+            events={k: v for k, v in events.items() if v},
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.bytes} bytes in {self.frames} frame(s): "
+            f"{self.full_clears} full clear(s), {self.partial_clears} partial clear(s), "
+            f"{self.cursor_moves} cursor move(s), {self.sgr} SGR "
+            f"({self.redundant_sgr} redundant), {self.chars_drawn} chars drawn"
+        )
+
+
+class RedrawAnalyzer:
+    """pyte stream listener that classifies events and forwards them to a screen.
+
+    Attach it in place of the screen (``pyte.ByteStream(analyzer)``);
+    every event is counted and then dispatched to the wrapped screen,
+    so the input is parsed only once.  Each chunk passed to
+    ``record_frame()`` counts as one frame.
+
+    Pass the lock held while feeding the stream as *lock* so readers
+    see consistent counters.
+    """
+
+    def __init__(
+        self,
+        screen: pyte.Screen,
+        *,
+        lock: threading.RLock | None = None,
+        max_frames: int = 10_000,
+    ) -> None:
+        self._screen = screen
+        # Share the terminal's lock: events are counted while it feeds.
+        self._lock = lock if lock is not None else threading.RLock()
+        self._counts: Counter[str] = Counter()
+        self._bytes = 0
+        self._frame_bytes: deque[int] = deque(maxlen=max_frames)
+        self._frames = 0
+        self._last_frame_at: float | None = None
+        self._input_at: float | None = None
+        self._input_mark = RedrawStats()
+
+    # -- pyte listener protocol --
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        target = getattr(self._screen, name)
+        if name not in pyte.Stream.events or not callable(target):
+            return target
+        return self._wrap(name, target)
+
+    def _wrap(self, name: str, target: Callable[..., Any]) -> Callable[..., Any]:
+        special = {
+            "draw": self._wrap_draw,
+            "select_graphic_rendition": self._wrap_sgr,
+            "erase_in_display": self._wrap_erase_in_display,
+        }.get(name)
+        if special is not None:
+            return special(target)
+
+        counts = self._counts
+
+        def forward(*args: Any, **kwargs: Any) -> None:
+            counts[name] += 1
+            target(*args, **kwargs)
+
+        return forward
+
+    def _wrap_draw(self, target: Callable[..., Any]) -> Callable[..., Any]:
+        counts = self._counts
+
+        def draw(data: str) -> None:
+            counts["draw"] += 1
+            counts["chars_drawn"] += len(data)
+            target(data)
+
+        return draw
+
+    def _wrap_sgr(self, target: Callable[..., Any]) -> Callable[..., Any]:
+        counts = self._counts
+        cursor_owner = self._screen
+
+        def select_graphic_rendition(*attrs: int, **kwargs: Any) -> None:
+            before = cursor_owner.cursor.attrs
+            target(*attrs, **kwargs)
+            counts["select_graphic_rendition"] += 1
+            if not attrs or attrs == (0,):
+                counts["sgr_resets"] += 1
+            if cursor_owner.cursor.attrs == before:
+                counts["redundant_sgr"] += 1
+
+        return select_graphic_rendition
+
+    def _wrap_erase_in_display(self, target: Callable[..., Any]) -> Callable[..., Any]:
+        counts = self._counts
+        screen = self._screen
+
+        def erase_in_display(how: int = 0, *args: Any, **kwargs: Any) -> None:
+            counts["erase_in_display"] += 1
+            # "Erase below" from the home position (CSI H CSI J) clears it all too
+            home = screen.cursor.x == 0 and screen.cursor.y == 0
+            if how in (2, 3) or (how == 0 and home):
+                counts["full_clears"] += 1
+            target(how, *args, **kwargs)
+
+        return erase_in_display
+
+    # -- Frame and input bookkeeping --
+
+    def record_frame(self, size: int, timestamp: float | None = None) -> None:
+        """Record one chunk of *size* bytes as a frame."""
+        with self._lock:
+            self._bytes += size
+            self._frames += 1
+            self._frame_bytes.append(size)
+            self._last_frame_at = time.monotonic() if timestamp is None else timestamp
+
+    def mark_input(self) -> None:
+        """Start a new "since input" window (called on every ``write()``)."""
+        stats = self.total
+        with self._lock:
+            self._input_mark = stats
+            self._input_at = time.monotonic()
+
+    def idle_for(self) -> float:
+        """Seconds since the last frame or input, whichever is later."""
+        with self._lock:
+            latest = max(
+                (t for t in (self._last_frame_at, self._input_at) if t is not None),
+                default=None,
+            )
+        return float("inf") if latest is None else time.monotonic() - latest
+
+    @property
+    def total(self) -> RedrawStats:
+        """Counters since the terminal started."""
+        with self._lock:
+            counts = dict(self._counts)
+            bytes_read = self._bytes
+            frames = self._frames
+        full_display_clears = counts.pop("full_clears", 0)
+        partial_display_clears = counts.get("erase_in_display", 0) - full_display_clears
+        return RedrawStats(
+            bytes=bytes_read,
+            frames=frames,
+            chars_drawn=counts.pop("chars_drawn", 0),
+            full_clears=full_display_clears + counts.get("reset", 0),
+            partial_clears=partial_display_clears
+            + sum(counts.get(e, 0) for e in _PARTIAL_CLEAR_EVENTS),
+            cursor_moves=sum(counts.get(e, 0) for e in _CURSOR_EVENTS),
+            scrolls=sum(counts.get(e, 0) for e in _SCROLL_EVENTS),
+            sgr=counts.get("select_graphic_rendition", 0),
+            sgr_resets=counts.pop("sgr_resets", 0),
+            redundant_sgr=counts.pop("redundant_sgr", 0),
+            events=counts,
+        )
+
+    @property
+    def since_input(self) -> RedrawStats:
+        """Counters since the most recent ``write()``."""
+        stats = self.total
+        with self._lock:
+            return stats - self._input_mark
+
+    @property
+    def frame_bytes(self) -> list[int]:
+        """Size in bytes of each recorded frame (most recent ``max_frames``)."""
+        with self._lock:
+            return list(self._frame_bytes)
+
+    def histogram(self) -> dict[int, int]:
+        """Frame sizes bucketed by power of two: ``{upper_bound: count}``."""
+        buckets: Counter[int] = Counter()
+        for size in self.frame_bytes:
+            buckets[1 << max(size - 1, 0).bit_length()] += 1
+        return dict(sorted(buckets.items()))
@@ -0,0 +1,134 @@
+"""Unit tests for the redraw efficiency analyzer."""
+
+import threading
+
+import pyte
+
+from curtaincall.redraw import RedrawAnalyzer, RedrawStats
+
+
+def _analyzer(rows: int = 5, cols: int = 20) -> tuple[RedrawAnalyzer, pyte.ByteStream]:
+    screen = pyte.Screen(cols, rows)
+    analyzer = RedrawAnalyzer(screen)
+    return analyzer, pyte.ByteStream(analyzer)
+
+
+def describe_redraw_analyzer():
+
+    def it_forwards_events_to_screen():
+        analyzer, stream = _analyzer()
+        stream.feed(b"Hello\x1b[1;3HX")
+        assert analyzer._screen.display[0].startswith("HeXlo")
+
+    def it_counts_drawn_characters():
+        analyzer, stream = _analyzer()
+        stream.feed(b"Hello")
+        assert analyzer.total.chars_drawn == 5
+
+    def it_classifies_full_clears():
+        analyzer, stream = _analyzer()
+        stream.feed(b"\x1b[2J\x1b[3J\x1bc")
+        assert analyzer.total.full_clears == 3
+
+    def it_treats_erase_below_from_home_as_full_clear():
+        analyzer, stream = _analyzer()
+        stream.feed(b"abc\x1b[H\x1b[J")
+        assert analyzer.total.full_clears == 1
+        assert analyzer.total.partial_clears == 0
+
+    def it_classifies_partial_clears():
+        analyzer, stream = _analyzer()
+        stream.feed(b"abc\x1b[K\x1b[2X\x1b[J")
+        stats = analyzer.total
+        assert stats.partial_clears == 3
+        assert stats.full_clears == 0
+
+    def it_counts_cursor_movement():
+        analyzer, stream = _analyzer()
+        stream.feed(b"\x1b[2;2H\x1b[A\x1b[B\x1b[C\x1b[D\x1b[5G\x1b7\x1b8")
+        assert analyzer.total.cursor_moves == 8
+
+    def it_counts_redundant_sgr():
+        analyzer, stream = _analyzer()
+        stream.feed(b"\x1b[31mA\x1b[31mB\x1b[0m\x1b[m")
+        stats = analyzer.total
+        assert stats.sgr == 4
+        assert stats.sgr_resets == 2
+        # Repeated red, and the second reset after the first
+        assert stats.redundant_sgr == 2
+
+    def it_counts_scrolls():
+        analyzer, stream = _analyzer(rows=2)
+        stream.feed(b"\x1bD\x1bD\x1bM")
+        assert analyzer.total.scrolls == 3
+
+    def it_keeps_raw_event_counts():
+        analyzer, stream = _analyzer()
+        stream.feed(b"a\r\nb")
+        events = analyzer.total.events
+        assert events["carriage_return"] == 1
+        assert events["linefeed"] == 1
+
+    def it_records_frames_and_histogram():
+        analyzer, _ = _analyzer()
+        for size in (1, 3, 4, 100):
+            analyzer.record_frame(size, timestamp=0.0)
+        stats = analyzer.total
+        assert stats.bytes == 108
+        assert stats.frames == 4
+        assert analyzer.frame_bytes == [1, 3, 4, 100]
+        assert analyzer.histogram() == {1: 1, 4: 2, 128: 1}
+
+    def it_bounds_frame_history():
+        screen = pyte.Screen(10, 2)
+        analyzer = RedrawAnalyzer(screen, max_frames=2)
+        for size in (1, 2, 3):
+            analyzer.record_frame(size)
+        assert analyzer.frame_bytes == [2, 3]
+        assert analyzer.total.frames == 3
+
+    def it_measures_since_input():
+        analyzer, stream = _analyzer()
+        stream.feed(b"\x1b[2Jbefore")
+        analyzer.record_frame(10)
+        analyzer.mark_input()
+        stream.feed(b"\x1b[Kafter")
+        analyzer.record_frame(8)
+        since = analyzer.since_input
+        assert since.bytes == 8
+        assert since.frames == 1
+        assert since.full_clears == 0
+        assert since.partial_clears == 1
+        assert since.chars_drawn == 5
+
+    def it_reports_idle_time():
+        analyzer, _ = _analyzer()
+        assert analyzer.idle_for() == float("inf")
+        analyzer.mark_input()
+        assert analyzer.idle_for() < 1.0
+
+    def it_shares_the_given_lock():
+        lock = threading.RLock()
+        analyzer = RedrawAnalyzer(pyte.Screen(10, 2), lock=lock)
+        assert analyzer._lock is lock
+
+    def it_does_not_proxy_private_attributes():
+        analyzer, _ = _analyzer()
+        assert not hasattr(analyzer, "_missing")
+
+
+def describe_redraw_stats():
+
+    def it_subtracts_counters():
+        later = RedrawStats(bytes=10, frames=2, full_clears=1, events={"draw": 3, "bell": 1})
+        earlier = RedrawStats(bytes=4, frames=1, events={"draw": 1, "bell": 1})
+        delta = later - earlier
+        assert delta.bytes == 6
+        assert delta.frames == 1
+        assert delta.full_clears == 1
+        assert delta.events == {"draw": 2}
+
+    def it_formats_summary():
+        text = str(RedrawStats(bytes=42, frames=3, full_clears=1))
+        assert "42 bytes in 3 frame(s)" in text
+        assert "1 full clear(s)" in text
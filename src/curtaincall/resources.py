@@ -0,0 +1,106 @@
+"""Low-overhead resource sampling for a terminal's process tree."""
+
+from __future__ import annotations
+
+import threading
+
+from curtaincall import procfs
+from curtaincall.types import ResourceUsage
+
+
+def tree_cpu_time(pid: int) -> float:
+    """Return the current CPU time (seconds) of *pid* and its live descendants."""
+    total = 0.0
+    for member in [pid, *procfs.descendants(pid)]:
+        stat = procfs.read_stat(member)
+        if stat is not None:
+            total += stat.cpu_time
+    return total
+
+
+class ResourceSampler:
+    """Samples RSS, CPU time, fds, and threads of a process and its descendants.
+
+    Each sample reads ``/proc/<pid>/stat``, ``status``, and ``fd`` for
+    every process in the tree.  ``start()`` runs sampling on a daemon
+    thread every *interval* seconds; ``sample()`` can also be called
+    directly.  CPU time of a process is remembered after it exits.
+    """
+
+    def __init__(self, pid: int, *, interval: float = 0.1) -> None:
+        if not procfs.is_available():
+            raise RuntimeError("Resource sampling requires Linux /proc")
+        self._pid = pid
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._samples = 0
+        self._rss_total = 0
+        self._peak_rss = 0
+        self._peak_fds = 0
+        self._peak_threads = 0
+        self._peak_processes = 0
+        self._cpu_by_pid: dict[int, float] = {}
+
+    def sample(self) -> None:
+        """Take one sample of the whole process tree."""
+        rss = 0
+        fds = 0
+        threads = 0
+        processes = 0
+        max_hwm = 0
+        cpu: dict[int, float] = {}
+        for pid in [self._pid, *procfs.descendants(self._pid)]:
+            stat = procfs.read_stat(pid)
+            if stat is None or stat.state == "Z":
+                continue
+            processes += 1
+            rss += stat.rss
+            threads += stat.threads
+            fds += procfs.count_fds(pid) or 0
+            max_hwm = max(max_hwm, procfs.read_peak_rss(pid) or 0)
+            cpu[pid] = stat.cpu_time
+
+        if not processes:
+            return
+        with self._lock:
+            self._samples += 1
+            self._rss_total += rss
+            # A process's VmHWM also catches spikes that fell between samples
+            self._peak_rss = max(self._peak_rss, rss, max_hwm)
+            self._peak_fds = max(self._peak_fds, fds)
+            self._peak_threads = max(self._peak_threads, threads)
+            self._peak_processes = max(self._peak_processes, processes)
+            self._cpu_by_pid.update(cpu)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self._interval)
+
+    def start(self) -> None:
+        """Start sampling on a background thread."""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, keeping the collected usage."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    @property
+    def usage(self) -> ResourceUsage:
+        """Aggregate usage over all samples taken so far."""
+        with self._lock:
+            return ResourceUsage(
+                samples=self._samples,
+                peak_rss=self._peak_rss,
+                avg_rss=self._rss_total / self._samples if self._samples else 0.0,
+                cpu_time=sum(self._cpu_by_pid.values()),
+                peak_fds=self._peak_fds,
+                peak_threads=self._peak_threads,
+                peak_processes=self._peak_processes,
+            )
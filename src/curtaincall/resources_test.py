@@ -0,0 +1,98 @@
+"""Unit tests for process-tree resource sampling."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from curtaincall import procfs
+from curtaincall.resources import ResourceSampler, tree_cpu_time
+
+pytestmark = pytest.mark.skipif(not procfs.is_available(), reason="requires /proc")
+
+
+def _stat(pid, *, rss=1024, cpu=1.0, threads=1, state="S"):
+    return procfs.ProcStat(
+        pid=pid, ppid=1, pgid=pid, sid=pid, state=state, cpu_time=cpu, threads=threads, rss=rss
+    )
+
+
+def describe_resource_sampler():
+
+    def it_samples_own_process():
+        sampler = ResourceSampler(os.getpid())
+        sampler.sample()
+        usage = sampler.usage
+        assert usage.samples == 1
+        assert usage.peak_rss > 0
+        assert usage.peak_fds > 0
+        assert usage.peak_threads >= 1
+        assert usage.cpu_time > 0
+
+    @patch("curtaincall.resources.procfs")
+    def it_aggregates_tree_and_samples(mock_procfs):
+        mock_procfs.descendants.return_value = [2]
+        mock_procfs.count_fds.return_value = 4
+        mock_procfs.read_peak_rss.return_value = None
+        mock_procfs.read_stat.side_effect = [
+            _stat(1, rss=100, cpu=1.0),
+            _stat(2, rss=50, cpu=0.5, threads=3),
+            _stat(1, rss=300, cpu=2.0),
+            None,  # child 2 exited
+        ]
+        sampler = ResourceSampler(1)
+        sampler.sample()
+        sampler.sample()
+        usage = sampler.usage
+        assert usage.samples == 2
+        assert usage.peak_rss == 300
+        assert usage.avg_rss == 225
+        assert usage.peak_threads == 4
+        assert usage.peak_fds == 8
+        assert usage.peak_processes == 2
+        # The exited child's last CPU time is kept
+        assert usage.cpu_time == 2.5
+
+    @patch("curtaincall.resources.procfs")
+    def it_uses_high_water_mark_for_peak(mock_procfs):
+        mock_procfs.descendants.return_value = []
+        mock_procfs.count_fds.return_value = 1
+        mock_procfs.read_peak_rss.return_value = 9000
+        mock_procfs.read_stat.return_value = _stat(1, rss=100)
+        sampler = ResourceSampler(1)
+        sampler.sample()
+        assert sampler.usage.peak_rss == 9000
+
+    @patch("curtaincall.resources.procfs")
+    def it_skips_zombies(mock_procfs):
+        mock_procfs.descendants.return_value = []
+        mock_procfs.read_stat.return_value = _stat(1, state="Z")
+        sampler = ResourceSampler(1)
+        sampler.sample()
+        assert sampler.usage.samples == 0
+
+    def it_samples_in_background():
+        sampler = ResourceSampler(os.getpid(), interval=0.01)
+        sampler.start()
+        try:
+            for _ in range(200):
+                if sampler.usage.samples >= 3:
+                    break
+                sampler._stop.wait(0.01)
+        finally:
+            sampler.stop()
+        assert sampler.usage.samples >= 3
+
+    @patch("curtaincall.resources.procfs.is_available", return_value=False)
+    def it_requires_proc(_mock):
+        with pytest.raises(RuntimeError, match="/proc"):
+            ResourceSampler(1)
+
+
+def describe_tree_cpu_time():
+
+    def it_sums_own_cpu_time():
+        assert tree_cpu_time(os.getpid()) > 0
+
+    def it_is_zero_for_missing_process():
+        assert tree_cpu_time(2**22 + 1) == 0.0
@@ -0,0 +1,232 @@
+"""Persistent shell sessions that run many commands in one PTY."""
+
+from __future__ import annotations
+
+import re
+import shlex
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from curtaincall.locator import Locator
+from curtaincall.terminal import Terminal
+
+# OSC 133 semantic prompt markers: A prompt start, B prompt end (ready for
+# input), C command output start, D;<status> command finished.
+_MARKER_RE = re.compile(rb"\x1b\]133;([ABCD])(?:;([^\x07\x1b]*))?(?:\x07|\x1b\\)")
+_MARKER_PREFIX = b"\x1b]133;"
+_MAX_MARKER_LEN = 64
+
+_BASH_RC = r"""
+unset HISTFILE
+bind 'set enable-bracketed-paste off' 2>/dev/null
+__curtaincall_status() { printf '\e]133;D;%s\a' "$?"; }
+PROMPT_COMMAND=__curtaincall_status
+PS1=$'\[\e]133;A\a\]$ \[\e]133;B\a\]'
+PS0=$'\e]133;C\a'
+"""
+
+_ZSH_RC = r"""
+unset HISTFILE
+setopt NO_PROMPT_SP
+__curtaincall_precmd() { printf '\e]133;D;%s\a' "$?"; }
+__curtaincall_preexec() { printf '\e]133;C\a'; }
+precmd_functions+=(__curtaincall_precmd)
+preexec_functions+=(__curtaincall_preexec)
+PS1=$'%{\e]133;A\a%}$ %{\e]133;B\a%}'
+"""
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    """The outcome of ``ShellSession.run()``.
+
+    ``rows`` are the buffer rows (scrollback + viewport coordinates)
+    holding the command's output; ``get_by_text()`` searches only those.
+    ``output`` is the text of that region when the command finished,
+    with trailing whitespace stripped from each line.
+    """
+
+    command: str
+    exit_code: int | None
+    rows: range
+    output: str
+    session: ShellSession = field(repr=False, compare=False)
+
+    def get_by_text(
+        self,
+        text: str | re.Pattern[str],
+        *,
+        full: bool = False,
+    ) -> Locator:
+        """Create a locator that matches text within this command's output."""
+        return Locator(terminal=self.session, text=text, full=full, rows=self.rows)
+
+
+class ShellSession(Terminal):
+    """A long-lived bash or zsh that runs commands one after another.
+
+    The shell is started with its startup files replaced by a minimal rc
+    that emits OSC 133 semantic-prompt markers around every prompt and
+    command.  ``run()`` uses them to wait for a command to finish and to
+    find the rows its output occupies, so a test can run many commands
+    without respawning a terminal for each.
+
+    Usage:
+        shell = ShellSession("bash")
+        shell.start()
+        result = shell.run("ls -1")
+        assert result.exit_code == 0
+        expect(result.get_by_text("README.md")).to_be_visible()
+        shell.kill()
+
+    Output regions are buffer rows, so commands that clear the screen, or
+    sessions that overflow ``history``, can shift earlier results.
+    """
+
+    def __init__(
+        self,
+        shell: str = "bash",
+        *,
+        rows: int = 30,
+        cols: int = 80,
+        env: dict[str, str] | None = None,
+        history: int = 10_000,
+        spawner: str = "native",
+        sample_resources: float | None = None,
+    ) -> None:
+        name = Path(shell).name
+        if name.startswith("bash"):
+            self._shell_kind = "bash"
+        elif name.startswith("zsh"):
+            self._shell_kind = "zsh"
+        else:
+            raise ValueError(f"Unsupported shell {shell!r}; expected bash or zsh")
+        super().__init__(
+            shell,
+            rows=rows,
+            cols=cols,
+            env=env,
+            history=history,
+            spawner=spawner,
+            sample_resources=sample_resources,
+        )
+        self._shell = shell
+        self._rc_dir: str | None = None
+        self._partial = b""
+        self._markers = threading.Condition(self._lock)
+        self._at_prompt = False
+        self._output_start: int | None = None
+        self._finished: list[tuple[range, int | None, str]] = []
+
+    def start(self) -> None:
+        """Write the marker rc file and spawn the shell."""
+        self._rc_dir = tempfile.mkdtemp(prefix="curtaincall-shell-")
+        rc_dir = Path(self._rc_dir)
+        if self._shell_kind == "bash":
+            rc = rc_dir / "bashrc"
+            rc.write_text(_BASH_RC)
+            self._command = shlex.join([self._shell, "--noprofile", "--rcfile", str(rc), "-i"])
+        else:
+            (rc_dir / ".zshrc").write_text(_ZSH_RC)
+            self._env = {**(self._env or {}), "ZDOTDIR": str(rc_dir)}
+            self._command = shlex.join([self._shell, "-d", "-i"])
+        super().start()
+
+    def kill(self) -> None:
+        """Terminate the shell and remove its rc file."""
+        super().kill()
+        if self._rc_dir is not None:
+            shutil.rmtree(self._rc_dir, ignore_errors=True)
+            self._rc_dir = None
+
+    # -- Marker tracking --
+
+    def _emulate(self, data: bytes) -> None:
+        data = self._partial + data
+        self._partial = b""
+        # Hold back a trailing, possibly incomplete marker until the next chunk
+        tail_at = data.rfind(b"\x1b")
+        if tail_at != -1:
+            tail = data[tail_at:]
+            if (
+                len(tail) < _MAX_MARKER_LEN
+                and _MARKER_PREFIX.startswith(tail[: len(_MARKER_PREFIX)])
+                and b"\x07" not in tail
+            ):
+                self._partial = tail
+                data = data[:tail_at]
+
+        pos = 0
+        for match in _MARKER_RE.finditer(data):
+            self._stream.feed(data[pos : match.start()])
+            self._on_marker(match.group(1), match.group(2))
+            pos = match.end()
+        self._stream.feed(data[pos:])
+
+    def _cursor_row(self) -> int:
+        return len(self._screen.history.top) + self._screen.cursor.y
+
+    def _row_text(self, row: int) -> str:
+        top = self._screen.history.top
+        line = top[row] if row < len(top) else self._screen.buffer[row - len(top)]
+        return "".join(line[x].data for x in range(self._screen.columns))
+
+    def _on_marker(self, kind: bytes, param: bytes | None) -> None:
+        if kind == b"B":
+            self._at_prompt = True
+        elif kind == b"C":
+            self._at_prompt = False
+            self._output_start = self._cursor_row()
+        elif kind == b"D" and self._output_start is not None:
+            row, col = self._cursor_row(), self._screen.cursor.x
+            lines = [self._row_text(r).rstrip() for r in range(self._output_start, row)]
+            if col:
+                lines.append(self._row_text(row)[:col].rstrip())
+                row += 1
+            exit_code = int(param) if param and param.isdigit() else None
+            output = "\n".join(lines).rstrip("\n")
+            self._finished.append((range(self._output_start, row), exit_code, output))
+            self._output_start = None
+        self._markers.notify_all()
+
+    # -- Commands --
+
+    def _wait_for_marker(self, predicate: Callable[[], bool], deadline: float) -> bool:
+        """Wait (holding ``_markers``) until *predicate* holds or *deadline* passes.
+
+        Raises RuntimeError if the shell exits first.
+        """
+        while not predicate():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._markers.wait(min(remaining, 0.05))
+            if not predicate() and not self.is_alive:
+                raise RuntimeError(f"Shell exited with code {self.exit_code}")
+        return True
+
+    def run(self, command: str, *, timeout: float = 10.0) -> CommandResult:
+        """Run *command* at the prompt and wait for it to finish.
+
+        Raises TimeoutError if the shell is not ready for input, or the
+        command does not finish, within *timeout* seconds.
+        """
+        deadline = time.monotonic() + timeout
+        with self._markers:
+            if not self._wait_for_marker(lambda: self._at_prompt, deadline):
+                raise TimeoutError(f"Shell was not ready for input within {timeout}s")
+            index = len(self._finished)
+            self._at_prompt = False
+        self.submit(command)
+        with self._markers:
+            if not self._wait_for_marker(lambda: len(self._finished) > index, deadline):
+                raise TimeoutError(f"Command did not finish within {timeout}s: {command!r}")
+            rows, exit_code, output = self._finished[index]
+        return CommandResult(
+            command=command, exit_code=exit_code, rows=rows, output=output, session=self
+        )
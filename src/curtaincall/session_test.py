@@ -0,0 +1,84 @@
+"""Unit tests for ShellSession marker tracking (no shell spawned)."""
+
+import pytest
+
+from curtaincall.session import CommandResult, ShellSession
+
+A = b"\x1b]133;A\x07"
+B = b"\x1b]133;B\x07"
+C = b"\x1b]133;C\x07"
+
+
+def D(status: int) -> bytes:
+    return f"\x1b]133;D;{status}\x07".encode()
+
+
+def _session() -> ShellSession:
+    return ShellSession("bash", rows=5, cols=20)
+
+
+def describe_shell_session_init():
+
+    def it_accepts_bash_and_zsh_paths():
+        assert ShellSession("/bin/bash")._shell_kind == "bash"
+        assert ShellSession("/usr/local/bin/zsh")._shell_kind == "zsh"
+
+    def it_rejects_other_shells():
+        with pytest.raises(ValueError, match="Unsupported shell"):
+            ShellSession("fish")
+
+
+def describe_marker_tracking():
+
+    def it_strips_markers_from_the_screen():
+        session = _session()
+        session._feed(A + b"$ " + B)
+        assert session._get_screen_text().startswith("$")
+        assert "133" not in session._get_screen_text()
+        assert session._at_prompt is True
+
+    def it_records_output_region_and_exit_status():
+        session = _session()
+        session._feed(A + b"$ " + B + b"ls\r\n" + C + b"a\r\nb\r\n" + D(2) + A + b"$ " + B)
+        [(rows, exit_code, output)] = session._finished
+        assert rows == range(1, 3)
+        assert exit_code == 2
+        assert output == "a\nb"
+
+    def it_includes_partial_last_line():
+        session = _session()
+        session._feed(A + b"$ " + B + b"printf x\r\n" + C + b"x" + D(0) + A + b"$ " + B)
+        [(rows, _exit_code, output)] = session._finished
+        assert rows == range(1, 2)
+        assert output == "x"
+
+    def it_ignores_status_before_first_command():
+        session = _session()
+        session._feed(D(0) + A + b"$ " + B)
+        assert session._finished == []
+
+    def it_handles_markers_split_across_chunks():
+        session = _session()
+        data = A + b"$ " + B + b"true\r\n" + C + D(0) + A + b"$ " + B
+        for i in range(len(data)):
+            session._feed(data[i : i + 1])
+        assert len(session._finished) == 1
+        assert session._finished[0][1] == 0
+        assert "133" not in session._get_screen_text()
+
+    def it_accepts_string_terminator():
+        session = _session()
+        session._feed(b"\x1b]133;B\x1b\\")
+        assert session._at_prompt is True
+
+
+def describe_command_result():
+
+    def it_scopes_locators_to_its_rows():
+        session = _session()
+        session._feed(b"match\r\nmatch\r\nother")
+        result = CommandResult(
+            command="x", exit_code=0, rows=range(1, 2), output="match", session=session
+        )
+        assert [cell.row for cell in result.get_by_text("match").cells] == [1] * 5
+        assert not result.get_by_text("other").is_visible()
@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
 import re
-import shlex
+import select
 import threading
 import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-import pexpect
 import pyte
 
-from curtaincall import ansi
+from curtaincall import ansi, process
+from curtaincall.capture import StreamCapture
 from curtaincall.locator import Locator
+from curtaincall.redraw import RedrawAnalyzer
+from curtaincall.resources import ResourceSampler
 from curtaincall.snapshot import render_snapshot
-from curtaincall.types import CursorPosition
+from curtaincall.types import CursorPosition, ResourceUsage, TerminalMetrics
 
 if TYPE_CHECKING:
-    pass
+    from curtaincall.process import ChildProcess
 
 
 class Terminal:
@@ -29,9 +34,25 @@ class Terminal:
 
     Uses pyte.HistoryScreen for scrollback buffer support so that content
     scrolled off the visible viewport is still searchable by locators.
+
+    Pass ``sample_resources=<seconds>`` to sample the memory, CPU, file
+    descriptors, and threads of the child and its descendants at that
+    interval (Linux only); see ``resources``.  Pass ``analyze_redraws=True``
+    to classify the escape sequences the app emits; see ``redraws``.
+
+    The child is started with curtaincall's own PTY spawner; pass
+    ``spawner="pexpect"`` to launch it through ``pexpect.spawn`` instead,
+    or ``spawner="forkserver"`` to fork Python programs from a warm
+    interpreter (other commands fall back to the native spawner; see
+    ``spawner``).
+
+    ``stderr`` selects where the child's stderr goes: ``"merge"`` (the
+    terminal, the default), ``"discard"``, or ``"capture"`` to a
+    separate bounded buffer exposed as ``term.stderr``.
+    ``suppress_stderr=True`` is shorthand for ``stderr="discard"``.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         command: str,
         *,
@@ -40,25 +61,61 @@ class Terminal:
         env: dict[str, str] | None = None,
         history: int = 1000,
         suppress_stderr: bool = False,
+        sample_resources: float | None = None,
+        analyze_redraws: bool = False,
+        spawner: str = "native",
+        stderr: str | None = None,
     ) -> None:
-        if suppress_stderr:
-            self._command = f"bash -c {shlex.quote(command + ' 2>/dev/null')}"
-        else:
-            self._command = command
+        if spawner not in process.SPAWNERS:
+            raise ValueError(f"Unknown spawner {spawner!r}; expected one of {process.SPAWNERS}")
+        if stderr is None:
+            stderr = "discard" if suppress_stderr else "merge"
+        elif suppress_stderr and stderr != "discard":
+            raise ValueError(f"suppress_stderr=True conflicts with stderr={stderr!r}")
+        if stderr not in process.STDERR_MODES:
+            raise ValueError(
+                f"Unknown stderr mode {stderr!r}; expected one of {process.STDERR_MODES}"
+            )
+        if stderr == "capture" and spawner == "pexpect":
+            raise ValueError('stderr="capture" is not supported by the pexpect spawner')
+        self._command = command
+        self._stderr_mode = stderr
         self._rows = rows
         self._cols = cols
         self._env = env
+        self._spawner = spawner
+        self._sample_interval = sample_resources
+        self._sampler: ResourceSampler | None = None
 
         self._screen: pyte.HistoryScreen = pyte.HistoryScreen(
             cols,
             rows,
             history=history,
         )
-        self._stream = pyte.ByteStream(self._screen)
-        self._child: pexpect.spawn | None = None
+        self._child: ChildProcess | None = None
         self._reader_thread: threading.Thread | None = None
+        self._stderr: StreamCapture | None = StreamCapture() if stderr == "capture" else None
+        self._stderr_thread: threading.Thread | None = None
         self._lock = threading.RLock()
+        self._redraw: RedrawAnalyzer | None = None
+        if analyze_redraws:
+            self._redraw = RedrawAnalyzer(self._screen, lock=self._lock)
+            self._stream = pyte.ByteStream(self._redraw)
+        else:
+            self._stream = pyte.ByteStream(self._screen)
         self._running = False
+        # Self-pipe that wakes the reader threads when the terminal is killed
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+
+        # Metrics, written by the reader thread under ``_lock``
+        self._started_at: float | None = None
+        self._spawn_time: float | None = None
+        self._first_output_at: float | None = None
+        self._bytes_read = 0
+        self._pending_input_at: float | None = None
+        self._input_latencies: list[float] = []
+        self._output_listeners: list[Callable[[bytes, float], None]] = []
 
     def start(self) -> None:
         """Spawn the child process and start reading its output."""
@@ -69,35 +126,104 @@ class Terminal:
         if self._env:
             spawn_env.update(self._env)
 
-        self._child = pexpect.spawn(
+        self._started_at = time.monotonic()
+        self._child = process.spawn(
             self._command,
-            dimensions=(self._rows, self._cols),
             env=spawn_env,
-            encoding=None,  # binary mode
+            rows=self._rows,
+            cols=self._cols,
+            spawner=self._spawner,
+            stderr=self._stderr_mode,
         )
+        self._spawn_time = time.monotonic() - self._started_at
+        if self._sample_interval is not None:
+            self._sampler = ResourceSampler(self._child.pid, interval=self._sample_interval)
+            self._sampler.start()
         self._running = True
+        self._wake_r, self._wake_w = os.pipe()
         self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
         self._reader_thread.start()
+        if self._stderr is not None:
+            self._stderr_thread = threading.Thread(target=self._stderr_loop, daemon=True)
+            self._stderr_thread.start()
 
     def _reader_loop(self) -> None:
         """Background loop: read PTY output and feed it to the VT100 emulator."""
         assert self._child is not None
         while self._running:
+            if not self._wait_readable(self._child.fileno()):
+                continue
             try:
-                data = self._child.read_nonblocking(4096, timeout=0.05)
-                if data:
-                    with self._lock:
-                        self._stream.feed(data)
-            except pexpect.TIMEOUT:
+                data = self._child.read_nonblocking(4096, timeout=0)
+            except EOFError:
+                break
+            if data:
+                self._feed(data)
+
+    def _stderr_loop(self) -> None:
+        """Background loop: copy the captured stderr pipe into ``term.stderr``."""
+        assert self._child is not None and self._stderr is not None
+        fd = self._child.stderr_fd
+        assert fd is not None
+        while self._running:
+            if not self._wait_readable(fd):
                 continue
-            except pexpect.EOF:
+            data = os.read(fd, 4096)
+            if not data:
                 break
+            self._stderr.feed(data)
+
+    def _wait_readable(self, fd: int) -> bool:
+        """Block until *fd* is readable; False if woken by ``kill()`` instead.
+
+        The timeout is only a safety net; ``kill()`` writes to the wake pipe.
+        """
+        fds = [fd] if self._wake_r is None else [fd, self._wake_r]
+        ready, _, _ = select.select(fds, [], [], 1.0)
+        return fd in ready and self._running
+
+    def _feed(self, data: bytes) -> None:
+        """Feed a chunk of PTY output to the emulator and update metrics."""
+        now = time.monotonic()
+        with self._lock:
+            if self._first_output_at is None:
+                self._first_output_at = now
+            if self._pending_input_at is not None:
+                self._input_latencies.append(now - self._pending_input_at)
+                self._pending_input_at = None
+            self._bytes_read += len(data)
+            self._emulate(data)
+            if self._redraw is not None:
+                self._redraw.record_frame(len(data), now)
+            for listener in self._output_listeners:
+                listener(data, now)
+
+    def _emulate(self, data: bytes) -> None:
+        """Parse a chunk into the screen (called with ``_lock`` held)."""
+        self._stream.feed(data)
+
+    def add_output_listener(self, listener: Callable[[bytes, float], None]) -> None:
+        """Register a callback invoked after each chunk of output is emulated.
+
+        The callback receives the raw chunk and the reader-side
+        ``time.monotonic()`` timestamp at which it arrived.  It runs on
+        the reader thread while the terminal lock is held, so it can
+        query the screen but must return quickly.  Register listeners
+        before ``start()`` to observe the first chunk.
+        """
+        with self._lock:
+            self._output_listeners.append(listener)
 
     # -- Input methods --
 
     def write(self, text: str) -> None:
         """Send raw text to the PTY."""
         assert self._child is not None
+        with self._lock:
+            if self._pending_input_at is None:
+                self._pending_input_at = time.monotonic()
+            if self._redraw is not None:
+                self._redraw.mark_input()
         self._child.send(text)
 
     def submit(self, text: str) -> None:
@@ -241,6 +367,41 @@ class Terminal:
 
         return self.exit_code
 
+    @property
+    def pid(self) -> int | None:
+        """The pid of the child process, or None if not started."""
+        if self._child is None:
+            return None
+        return self._child.pid
+
+    @property
+    def spawner(self) -> str:
+        """The spawner that started the child.
+
+        Before ``start()`` this is the requested spawner.  After it, it is
+        the one actually used: ``"forkserver"`` falls back to ``"native"``
+        for commands the fork server cannot run.
+        """
+        if self._child is None:
+            return self._spawner
+        return self._child.spawner
+
+    @property
+    def resources(self) -> ResourceUsage:
+        """Resource usage of the child process and its descendants.
+
+        With ``sample_resources`` enabled this aggregates every sample
+        taken so far (and survives the process exiting).  Otherwise a
+        single sample is taken on demand.
+        """
+        if self._sampler is not None:
+            return self._sampler.usage
+        if self._child is None:
+            raise RuntimeError("Terminal has not been started")
+        sampler = ResourceSampler(self._child.pid)
+        sampler.sample()
+        return sampler.usage
+
     @property
     def exit_code(self) -> int | None:
         """The exit code of the child process, or None if still running."""
@@ -248,9 +409,54 @@ class Terminal:
             return None
         if self._child.isalive():
             return None
-        # pexpect stores the status after the process exits
+        # isalive() reaps the child and stores its status
         return self._child.exitstatus
 
+    @property
+    def stderr(self) -> StreamCapture:
+        """The child's stderr, captured separately from the screen.
+
+        Requires ``stderr="capture"``.  Search it like the screen:
+        ``expect(term.stderr.get_by_text("warning")).to_be_visible()``.
+        """
+        if self._stderr is None:
+            raise RuntimeError('stderr is not captured; pass stderr="capture"')
+        return self._stderr
+
+    # -- Metrics --
+
+    @property
+    def metrics(self) -> TerminalMetrics:
+        """Performance measurements collected so far.
+
+        ``spawn_time`` is how long ``start()`` took to launch the child.
+        ``time_to_first_output`` is the delay between ``start()`` and the
+        first chunk read from the PTY.  Each entry in ``input_latencies``
+        is the delay between a ``write()`` and the next chunk of output.
+        """
+        with self._lock:
+            first_output = None
+            if self._started_at is not None and self._first_output_at is not None:
+                first_output = self._first_output_at - self._started_at
+            return TerminalMetrics(
+                time_to_first_output=first_output,
+                input_latencies=tuple(self._input_latencies),
+                bytes_read=self._bytes_read,
+                spawn_time=self._spawn_time,
+            )
+
+    @property
+    def redraws(self) -> RedrawAnalyzer:
+        """Escape-sequence statistics for the app's output.
+
+        Requires ``analyze_redraws=True``.  ``redraws.total`` covers the
+        whole session and ``redraws.since_input`` the output since the
+        most recent ``write()``; both are ``RedrawStats``.
+        """
+        if self._redraw is None:
+            raise RuntimeError("Redraw analysis is disabled; pass analyze_redraws=True")
+        return self._redraw
+
     # -- Terminal control --
 
     def set_size(self, *, rows: int, cols: int) -> None:
@@ -262,15 +468,34 @@ class Terminal:
             self._screen.resize(rows, cols)
         self._child.setwinsize(rows, cols)
 
-    def kill(self) -> None:
-        """Terminate the child process and stop the reader thread."""
+    def _stop_threads(self) -> None:
+        """Wake and join the reader threads and stop the resource sampler."""
         self._running = False
-        if self._child is not None:
-            if self._child.isalive():
-                self._child.terminate(force=True)
-            self._child.close()
+        if self._wake_w is not None:
+            with contextlib.suppress(OSError):
+                os.write(self._wake_w, b"\0")
+        if self._sampler is not None:
+            self._sampler.stop()
+        # Stop the reader before closing the PTY it is reading from; the
+        # pexpect spawner also reaps the child from whichever thread
+        # notices it exited, so isalive() must not race with it.
         if self._reader_thread is not None:
             self._reader_thread.join(timeout=2.0)
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=2.0)
+
+    def kill(self) -> None:
+        """Terminate the child's process group and stop the reader thread."""
+        self._stop_threads()
+        if self._child is not None:
+            process.terminate_all([self._child])
+            self._child.close()
+        threads = (self._reader_thread, self._stderr_thread)
+        if not any(t is not None and t.is_alive() for t in threads):
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    os.close(fd)
+            self._wake_r = self._wake_w = None
 
     def to_snapshot(self) -> str:
         """Render the current screen as a box-drawn snapshot string."""
@@ -281,3 +506,40 @@ class Terminal:
         """Return the full buffer content (scrollback + viewport) as a string."""
         buf = self.get_buffer()
         return "\n".join("".join(row).rstrip() for row in buf)
+
+
+def start_all(terminals: Iterable[Terminal]) -> None:
+    """Start *terminals* concurrently, returning once every one is running.
+
+    If any fails to start, the ones that did are killed and the first
+    error is raised.
+    """
+    terminals = list(terminals)
+    if len(terminals) <= 1:
+        for term in terminals:
+            term.start()
+        return
+    with ThreadPoolExecutor(
+        max_workers=len(terminals), thread_name_prefix="curtaincall-start"
+    ) as executor:
+        futures = [executor.submit(term.start) for term in terminals]
+    errors = [f.exception() for f in futures if f.exception() is not None]
+    if errors:
+        kill_all(t for t, f in zip(terminals, futures, strict=True) if f.exception() is None)
+        raise errors[0]
+
+
+def kill_all(terminals: Iterable[Terminal]) -> None:
+    """Kill *terminals* together instead of one after another.
+
+    Every reader thread is woken at once, then the process groups of all
+    children still running are signalled together (see
+    ``process.terminate_all``), so teardown costs one escalation rather
+    than one per terminal.
+    """
+    terminals = list(terminals)
+    for term in terminals:
+        term._stop_threads()
+    process.terminate_all([t._child for t in terminals if t._child is not None])
+    for term in terminals:
+        term.kill()
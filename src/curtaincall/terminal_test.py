@@ -1,11 +1,13 @@
 """Unit tests for Terminal class (mocked PTY)."""
 
+import os
 import re
 import threading
+from functools import cache
 from unittest.mock import MagicMock, patch
 
-import pexpect
 import pyte
+import pytest
 
 from curtaincall import ansi
 from curtaincall.locator import Locator
@@ -18,6 +20,20 @@ def _make_terminal(rows: int = 5, cols: int = 20) -> Terminal:
     return Terminal("echo test", rows=rows, cols=cols)
 
 
+@cache
+def _readable_fd() -> int:
+    """A pipe that always polls readable, standing in for a mocked child's PTY."""
+    read_end, write_end = os.pipe()
+    os.write(write_end, b"x")
+    return read_end
+
+
+def _mock_child() -> MagicMock:
+    child = MagicMock()
+    child.fileno.return_value = _readable_fd()
+    return child
+
+
 def describe_terminal_init():
 
     def it_sets_dimensions():
@@ -49,30 +65,54 @@ def describe_terminal_init():
         term = Terminal("echo")
         assert term._env is None
 
-    def it_stores_command_with_suppress_stderr():
+    def it_discards_stderr_without_wrapping_command():
         term = Terminal("my-tool --help", suppress_stderr=True)
-        assert "2>/dev/null" in term._command
-        assert "my-tool --help" in term._command
-
-    def it_wraps_in_bash_for_suppress_stderr():
-        term = Terminal("my-tool --help", suppress_stderr=True)
-        assert term._command.startswith("bash -c ")
+        assert term._command == "my-tool --help"
+        assert term._stderr_mode == "discard"
 
-    def it_leaves_command_unchanged_without_suppress_stderr():
+    def it_merges_stderr_by_default():
         term = Terminal("my-tool --help")
         assert term._command == "my-tool --help"
+        assert term._stderr_mode == "merge"
+
+    def it_rejects_conflicting_stderr_options():
+        with pytest.raises(ValueError, match="conflicts"):
+            Terminal("echo", suppress_stderr=True, stderr="capture")
+
+    def it_rejects_unknown_stderr_mode():
+        with pytest.raises(ValueError, match="Unknown stderr mode"):
+            Terminal("echo", stderr="pipe")
+
+    def it_rejects_capture_with_pexpect_spawner():
+        with pytest.raises(ValueError, match="pexpect spawner"):
+            Terminal("echo", stderr="capture", spawner="pexpect")
+
+    def it_requires_capture_for_stderr_property():
+        with pytest.raises(RuntimeError, match="not captured"):
+            _ = _make_terminal().stderr
+        assert Terminal("echo", stderr="capture").stderr.text == ""
 
     def it_uses_reentrant_lock():
         term = _make_terminal()
         assert isinstance(term._lock, type(threading.RLock()))
 
+    def it_defaults_to_native_spawner():
+        assert _make_terminal()._spawner == "native"
+
+    def it_rejects_unknown_spawner():
+        with pytest.raises(ValueError, match="Unknown spawner"):
+            Terminal("echo", spawner="subprocess")
+
+    def it_allows_capture_with_forkserver_spawner():
+        assert Terminal("echo", stderr="capture", spawner="forkserver")._stderr_mode == "capture"
+
 
 def describe_terminal_start():
 
-    @patch("curtaincall.terminal.pexpect.spawn")
+    @patch("curtaincall.terminal.process.spawn")
     def it_spawns_child_process(mock_spawn):
-        mock_child = MagicMock()
-        mock_child.read_nonblocking.side_effect = pexpect.EOF("done")
+        mock_child = _mock_child()
+        mock_child.read_nonblocking.side_effect = EOFError("done")
         mock_spawn.return_value = mock_child
 
         term = _make_terminal(rows=10, cols=40)
@@ -81,18 +121,19 @@ def describe_terminal_start():
         mock_spawn.assert_called_once()
         call_kwargs = mock_spawn.call_args
         assert call_kwargs[0][0] == "echo test"
-        assert call_kwargs[1]["dimensions"] == (10, 40)
-        assert call_kwargs[1]["encoding"] is None
+        assert call_kwargs[1]["rows"] == 10
+        assert call_kwargs[1]["cols"] == 40
+        assert call_kwargs[1]["spawner"] == "native"
         assert term._running is True
         assert term._reader_thread is not None
 
         term._running = False
         term._reader_thread.join(timeout=1.0)
 
-    @patch("curtaincall.terminal.pexpect.spawn")
+    @patch("curtaincall.terminal.process.spawn")
     def it_sets_term_env(mock_spawn):
-        mock_child = MagicMock()
-        mock_child.read_nonblocking.side_effect = pexpect.EOF("done")
+        mock_child = _mock_child()
+        mock_child.read_nonblocking.side_effect = EOFError("done")
         mock_spawn.return_value = mock_child
 
         term = Terminal("echo", env={"MY_VAR": "123"})
@@ -105,6 +146,20 @@ def describe_terminal_start():
         term._running = False
         term._reader_thread.join(timeout=1.0)
 
+    @patch("curtaincall.terminal.process.spawn")
+    def it_reports_the_spawner_actually_used(mock_spawn):
+        mock_spawn.return_value = _mock_child()
+        mock_spawn.return_value.read_nonblocking.side_effect = EOFError("done")
+        mock_spawn.return_value.spawner = "native"
+
+        term = Terminal("echo", spawner="forkserver")
+        assert term.spawner == "forkserver"
+        term.start()
+        assert term.spawner == "native"
+
+        term._running = False
+        term._reader_thread.join(timeout=1.0)
+
 
 def describe_terminal_write():
 
@@ -400,7 +455,7 @@ def describe_terminal_reader_loop():
         term = _make_terminal(rows=3, cols=10)
         mock_child = MagicMock()
         # First call returns data, second raises EOF
-        mock_child.read_nonblocking.side_effect = [b"Hi", pexpect.EOF("done")]
+        mock_child.read_nonblocking.side_effect = [b"Hi", EOFError("done")]
         term._child = mock_child
         term._running = True
 
@@ -410,11 +465,11 @@ def describe_terminal_reader_loop():
 
     def it_handles_timeout():
         term = _make_terminal(rows=3, cols=10)
-        mock_child = MagicMock()
+        mock_child = _mock_child()
         mock_child.read_nonblocking.side_effect = [
-            pexpect.TIMEOUT("timeout"),
+            b"",
             b"OK",
-            pexpect.EOF("done"),
+            EOFError("done"),
         ]
         term._child = mock_child
         term._running = True
@@ -435,8 +490,8 @@ def describe_terminal_reader_loop():
 
     def it_skips_empty_data():
         term = _make_terminal(rows=3, cols=10)
-        mock_child = MagicMock()
-        mock_child.read_nonblocking.side_effect = [b"", b"X", pexpect.EOF("done")]
+        mock_child = _mock_child()
+        mock_child.read_nonblocking.side_effect = [b"", b"X", EOFError("done")]
         term._child = mock_child
         term._running = True
 
@@ -444,3 +499,133 @@ def describe_terminal_reader_loop():
 
         text = term._get_screen_text()
         assert "X" in text
+
+
+def describe_terminal_metrics():
+
+    def it_starts_empty():
+        term = _make_terminal()
+        metrics = term.metrics
+        assert metrics.time_to_first_output is None
+        assert metrics.input_latencies == ()
+        assert metrics.bytes_read == 0
+        assert metrics.spawn_time is None
+
+    @patch("curtaincall.terminal.process.spawn")
+    def it_measures_spawn_time(mock_spawn):
+        mock_spawn.return_value = _mock_child()
+        mock_spawn.return_value.read_nonblocking.side_effect = EOFError("done")
+        term = _make_terminal()
+        with patch("curtaincall.terminal.time.monotonic", side_effect=[5.0, 5.125]):
+            term.start()
+        term._reader_thread.join(timeout=1.0)
+        assert term.metrics.spawn_time == 0.125
+
+    def it_measures_time_to_first_output():
+        term = _make_terminal()
+        term._started_at = 10.0
+        with patch("curtaincall.terminal.time.monotonic", return_value=10.25):
+            term._feed(b"Hi")
+        assert term.metrics.time_to_first_output == 0.25
+
+    def it_counts_bytes_read():
+        term = _make_terminal()
+        term._feed(b"Hello")
+        term._feed(b", World")
+        assert term.metrics.bytes_read == 12
+
+    def it_measures_input_to_render_latency():
+        term = _make_terminal()
+        term._child = MagicMock()
+        with patch("curtaincall.terminal.time.monotonic", return_value=1.0):
+            term.write("a")
+            term.write("b")
+        with patch("curtaincall.terminal.time.monotonic", return_value=1.5):
+            term._feed(b"ab")
+            term._feed(b"more")
+        assert term.metrics.input_latencies == (0.5,)
+
+
+def describe_terminal_output_listeners():
+
+    def it_calls_listener_with_chunk_and_timestamp():
+        term = _make_terminal()
+        seen = []
+        term.add_output_listener(lambda data, ts: seen.append((data, ts)))
+        with patch("curtaincall.terminal.time.monotonic", return_value=3.0):
+            term._feed(b"Hi")
+        assert seen == [(b"Hi", 3.0)]
+
+    def it_calls_listener_after_emulation():
+        term = _make_terminal()
+        screens = []
+        term.add_output_listener(lambda _data, _ts: screens.append(term._get_screen_text()))
+        term._feed(b"Hello")
+        assert screens[0].startswith("Hello")
+
+
+def describe_terminal_resources():
+
+    def it_has_no_pid_before_start():
+        assert _make_terminal().pid is None
+
+    def it_reports_child_pid():
+        term = _make_terminal()
+        term._child = MagicMock(pid=1234)
+        assert term.pid == 1234
+
+    def it_requires_start_for_on_demand_sample():
+        import pytest
+
+        with pytest.raises(RuntimeError, match="not been started"):
+            _ = _make_terminal().resources
+
+    @patch("curtaincall.terminal.ResourceSampler")
+    def it_samples_on_demand_without_sampler(MockSampler):
+        term = _make_terminal()
+        term._child = MagicMock(pid=99)
+        usage = term.resources
+        MockSampler.assert_called_once_with(99)
+        MockSampler.return_value.sample.assert_called_once()
+        assert usage is MockSampler.return_value.usage
+
+    @patch("curtaincall.terminal.ResourceSampler")
+    @patch("curtaincall.terminal.process.spawn")
+    def it_starts_and_stops_background_sampler(mock_spawn, MockSampler):
+        mock_spawn.return_value = _mock_child()
+        mock_spawn.return_value.read_nonblocking.side_effect = EOFError("done")
+        mock_spawn.return_value.pid = 7
+        term = Terminal("echo", sample_resources=0.25)
+        term.start()
+        MockSampler.assert_called_once_with(7, interval=0.25)
+        MockSampler.return_value.start.assert_called_once()
+        assert term.resources is MockSampler.return_value.usage
+        term.kill()
+        MockSampler.return_value.stop.assert_called_once()
+
+
+def describe_terminal_redraws():
+
+    def it_is_disabled_by_default():
+        import pytest
+
+        with pytest.raises(RuntimeError, match="analyze_redraws"):
+            _ = _make_terminal().redraws
+
+    def it_classifies_fed_output():
+        term = Terminal("echo", rows=5, cols=20, analyze_redraws=True)
+        term._feed(b"\x1b[2JHello")
+        stats = term.redraws.total
+        assert stats.full_clears == 1
+        assert stats.bytes == 9
+        assert stats.frames == 1
+        assert "Hello" in term._get_screen_text()
+
+    def it_resets_since_input_on_write():
+        term = Terminal("echo", rows=5, cols=20, analyze_redraws=True)
+        term._child = MagicMock()
+        term._feed(b"\x1b[2JHello")
+        term.write("x")
+        term._feed(b"x")
+        assert term.redraws.since_input.bytes == 1
+        assert term.redraws.since_input.full_clears == 0
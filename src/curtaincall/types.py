@@ -23,3 +23,43 @@ class CellStyle:
     italic: bool = False
     underscore: bool = False
     reverse: bool = False
+
+
+@dataclass(frozen=True)
+class TerminalMetrics:
+    """Performance measurements collected while a terminal runs.
+
+    All durations are in seconds, measured with ``time.monotonic()`` on
+    the reader thread as output arrives from the PTY.  ``spawn_time`` is
+    the time ``start()`` spent launching the child.
+    """
+
+    time_to_first_output: float | None = None
+    input_latencies: tuple[float, ...] = ()
+    bytes_read: int = 0
+    spawn_time: float | None = None
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """Resource usage of a terminal's process tree (child plus descendants).
+
+    Memory is in bytes and CPU time in seconds (user + system, summed
+    over every process seen).  Peaks are taken across all samples.
+    """
+
+    samples: int = 0
+    peak_rss: int = 0
+    avg_rss: float = 0.0
+    cpu_time: float = 0.0
+    peak_fds: int = 0
+    peak_threads: int = 0
+    peak_processes: int = 0
+
+    @property
+    def peak_rss_mb(self) -> float:
+        return self.peak_rss / (1024 * 1024)
+
+    @property
+    def avg_rss_mb(self) -> float:
+        return self.avg_rss / (1024 * 1024)
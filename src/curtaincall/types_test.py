@@ -1,6 +1,6 @@
 """Unit tests for core data types."""
 
-from curtaincall.types import CellStyle, CursorPosition
+from curtaincall.types import CellStyle, CursorPosition, ResourceUsage
 
 
 def describe_cursor_position():
@@ -49,3 +49,16 @@ def describe_cell_style():
             raise AssertionError("Should have raised")
         except AttributeError:
             pass
+
+
+def describe_resource_usage():
+
+    def it_defaults_to_zero():
+        usage = ResourceUsage()
+        assert usage.samples == 0
+        assert usage.peak_rss == 0
+
+    def it_converts_to_megabytes():
+        usage = ResourceUsage(peak_rss=3 * 1024 * 1024, avg_rss=1024 * 1024)
+        assert usage.peak_rss_mb == 3.0
+        assert usage.avg_rss_mb == 1.0
@@ -0,0 +1,5 @@
+"""Spin on the CPU forever (simulates a TUI busy-looping while idle)."""
+
+print("Spinning", flush=True)
+while True:
+    pass
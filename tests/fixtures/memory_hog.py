@@ -0,0 +1,10 @@
+"""Allocate the given number of megabytes, then wait for input."""
+
+import sys
+
+mb = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+data = bytearray(mb * 1024 * 1024)
+for i in range(0, len(data), 4096):
+    data[i] = 1  # touch every page so it counts toward RSS
+print(f"Allocated {mb} MB", flush=True)
+sys.stdin.readline()
@@ -0,0 +1,64 @@
+"""Integration tests for --curtaincall-baseline regression reporting."""
+
+import json
+
+import pytest
+
+from curtaincall.baseline import BASELINE_VERSION
+
+
+@pytest.fixture
+def measured_test(pytester, fixture_cmd):
+    pytester.makepyfile(
+        test_measured=f"""
+        from curtaincall import expect
+
+        def test_hello(terminal):
+            term = terminal({fixture_cmd("hello.py")!r})
+            expect(term.get_by_text("Hello, World!")).to_be_visible()
+        """
+    )
+    return pytester
+
+
+def describe_baseline_option():
+
+    def it_writes_baseline_file(measured_test):
+        path = measured_test.path / "baseline.json"
+        result = measured_test.runpytest_subprocess(f"--curtaincall-baseline={path}")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*curtaincall baseline*", "*No regressions*"])
+        tests = json.loads(path.read_text())["tests"]
+        [metrics] = tests.values()
+        assert metrics["bytes_read"][0] > 0
+        assert metrics["time_to_first_output"][0] > 0
+
+    def it_reports_regressions_in_summary(measured_test):
+        path = measured_test.path / "baseline.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": BASELINE_VERSION,
+                    "tests": {"test_measured.py::test_hello": {"bytes_read": [1.0, 1.0]}},
+                }
+            )
+        )
+        result = measured_test.runpytest_subprocess(f"--curtaincall-baseline={path}")
+        result.assert_outcomes(passed=1)
+        assert result.ret == 0
+        result.stdout.fnmatch_lines(["*REGRESSION test_measured.py::test_hello: bytes_read*"])
+
+    def it_fails_session_on_regression_when_requested(measured_test):
+        path = measured_test.path / "baseline.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": BASELINE_VERSION,
+                    "tests": {"test_measured.py::test_hello": {"bytes_read": [1.0]}},
+                }
+            )
+        )
+        result = measured_test.runpytest_subprocess(
+            f"--curtaincall-baseline={path}", "--curtaincall-baseline-fail"
+        )
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
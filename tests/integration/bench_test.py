@@ -0,0 +1,47 @@
+"""Integration tests for startup benchmarking."""
+
+import pytest
+
+from curtaincall import bench
+
+
+def describe_startup():
+
+    def it_measures_time_to_screen_state(fixture_cmd):
+        stats = bench.startup(fixture_cmd("hello.py"), until="Hello, World!", runs=3, warmup=1)
+        assert len(stats.samples) == 3
+        assert 0 < stats.min <= stats.median <= stats.p95
+
+    def it_runs_concurrently(fixture_cmd):
+        stats = bench.startup(
+            fixture_cmd("hello.py"), until="Hello, World!", runs=4, warmup=0, concurrency=4
+        )
+        assert len(stats.samples) == 4
+
+    def it_times_out_when_state_never_appears(fixture_cmd):
+        with pytest.raises(TimeoutError, match="did not appear"):
+            bench.measure_startup(fixture_cmd("hello.py"), until="nope", timeout=0.5)
+
+
+def describe_spawn():
+
+    @pytest.mark.parametrize("spawner", ["native", "pexpect"])
+    def it_measures_spawn_latency(fixture_cmd, spawner):
+        stats = bench.spawn(fixture_cmd("hello.py"), runs=3, warmup=1, spawner=spawner)
+        assert len(stats.samples) == 3
+        assert stats.min > 0
+
+    # pexpect forks from a multi-threaded process (the native spawner does not)
+    @pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")
+    def it_measures_startup_with_either_spawner(fixture_cmd):
+        stats = bench.startup(
+            fixture_cmd("hello.py"), until="Hello, World!", runs=2, warmup=0, spawner="pexpect"
+        )
+        assert len(stats.samples) == 2
+
+
+def describe_startup_bench_fixture():
+
+    def it_wraps_bench_startup(startup_bench, fixture_cmd):
+        stats = startup_bench(fixture_cmd("hello.py"), until="Hello, World!", runs=2, warmup=0)
+        assert len(stats.samples) == 2
@@ -2,6 +2,9 @@
 
 import re
 import time
+from pathlib import Path
+
+import pytest
 
 from curtaincall import expect
 
@@ -192,6 +195,28 @@ def describe_suppress_stderr():
         assert "WARNING" not in text
         expect(term.get_by_text("Usage: my-tool")).to_be_visible()
 
+    def it_does_not_wrap_the_command_in_a_shell(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("signal_handler.py"), suppress_stderr=True)
+        expect(term.get_by_text("Running")).to_be_visible()
+        cmdline = Path(f"/proc/{term.pid}/cmdline").read_bytes().split(b"\0")
+        assert Path(cmdline[0].decode()).name.startswith("python")
+
+
+def describe_stderr_capture():
+
+    def it_captures_stderr_separately(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("stderr_warning.py"), rows=10, cols=60, stderr="capture")
+        expect(term.get_by_text("STDERR_DONE")).to_be_visible()
+        expect(term.stderr.get_by_text("WARNING 19: something went wrong")).to_be_visible()
+        assert "WARNING" not in term._get_screen_text()
+        assert len(term.stderr.lines) == 20
+
+    def it_fails_with_stderr_content(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("stderr_warning.py"), stderr="capture")
+        expect(term.get_by_text("STDERR_DONE")).to_be_visible()
+        with pytest.raises(AssertionError, match="WARNING 0"):
+            expect(term.stderr.get_by_text("Traceback")).to_be_visible(timeout=0.2)
+
 
 def describe_snapshot_edge_cases():
 
@@ -0,0 +1,67 @@
+"""Integration tests for the fork server spawner."""
+
+from curtaincall import expect
+
+
+def describe_forkserver_spawner():
+
+    def it_runs_python_fixtures(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("hello.py"), spawner="forkserver")
+        expect(term.get_by_text("Hello, World!")).to_be_visible()
+        assert term.spawner == "forkserver"
+
+    def it_supports_interactive_input(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("echo.py"), spawner="forkserver")
+        expect(term.get_by_text("ready>")).to_be_visible()
+        term.submit("hello")
+        expect(term.get_by_text("echo: hello")).to_be_visible()
+        term.submit("quit")
+        assert term.wait(timeout=5.0) == 0
+
+    def it_reports_exit_codes(terminal, fixture_cmd):
+        term = terminal(f"{fixture_cmd('exit_code.py')} 7", spawner="forkserver")
+        assert term.wait(timeout=5.0) == 7
+
+    def it_sees_the_terminal_size(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("resize_detect.py"), rows=20, cols=60, spawner="forkserver")
+        expect(term.get_by_text("60x20")).to_be_visible()
+
+    def it_stops_signal_handling_programs_on_kill(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("signal_handler.py"), spawner="forkserver")
+        expect(term.get_by_text("Running")).to_be_visible()
+        term.kill()
+        assert not term.is_alive
+
+    def it_captures_stderr(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("stderr_warning.py"), spawner="forkserver", stderr="capture")
+        expect(term.get_by_text("STDERR_DONE")).to_be_visible()
+        expect(term.stderr.get_by_text("WARNING 19")).to_be_visible()
+        assert not term.get_by_text("WARNING").is_visible()
+
+    def it_falls_back_to_native_for_non_python_commands(terminal):
+        term = terminal("echo fallback", spawner="forkserver")
+        expect(term.get_by_text("fallback")).to_be_visible()
+        assert term.spawner == "native"
+
+
+def describe_plugin_options():
+
+    def it_sets_the_default_spawner_and_preload(pytester, fixture_cmd):
+        pytester.makepyfile(
+            test_forked=f"""
+            from curtaincall import expect
+
+            def test_hello(terminal):
+                term = terminal({fixture_cmd("hello.py")!r})
+                expect(term.get_by_text("Hello, World!")).to_be_visible()
+                assert term.spawner == "forkserver"
+
+            def test_preloaded(terminal):
+                term = terminal("python -c 'import sys; print(\\"decimal\\" in sys.modules)'")
+                expect(term.get_by_text("True")).to_be_visible()
+            """
+        )
+        result = pytester.runpytest_subprocess(
+            "--curtaincall-spawner=forkserver", "--curtaincall-forkserver-preload=decimal"
+        )
+        result.assert_outcomes(passed=2)
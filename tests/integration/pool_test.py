@@ -0,0 +1,27 @@
+"""Integration tests for the pre-warmed terminal pool."""
+
+from curtaincall import expect
+
+
+def describe_terminal_pool_fixture():
+
+    def it_hands_out_ready_terminals(terminal_pool, fixture_cmd):
+        term = terminal_pool(fixture_cmd("echo.py"), size=2, ready="ready>")
+        assert term.get_by_text("ready>").is_visible()
+        term.submit("pooled")
+        expect(term.get_by_text("echo: pooled")).to_be_visible()
+
+    def it_reuses_the_pool_across_tests(terminal_pool, fixture_cmd, _curtaincall_pools):
+        term = terminal_pool(fixture_cmd("echo.py"), size=2, ready="ready>")
+        assert term.get_by_text("ready>").is_visible()
+        assert len(_curtaincall_pools) >= 1
+
+    def it_gives_each_call_its_own_terminal(terminal_pool, fixture_cmd):
+        first = terminal_pool(fixture_cmd("echo.py"), size=2, ready="ready>")
+        second = terminal_pool(fixture_cmd("echo.py"), size=2, ready="ready>")
+        assert first is not second
+        assert first.pid != second.pid
+
+    def it_passes_terminal_options(terminal_pool, fixture_cmd):
+        term = terminal_pool(fixture_cmd("hello.py"), size=1, rows=8, cols=40, ready="Hello")
+        assert len(term.get_viewable_buffer()) == 8
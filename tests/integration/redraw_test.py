@@ -0,0 +1,30 @@
+"""Integration tests for redraw efficiency analysis."""
+
+import pytest
+
+from curtaincall import expect
+
+
+def describe_redraw_analysis():
+
+    def it_counts_full_repaints_of_arrow_menu(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("arrow_menu.py"), rows=24, cols=80, analyze_redraws=True)
+        expect(term.get_by_text("Select an option:")).to_be_visible()
+        term.key_down()
+        expect(term.get_by_text("> Option B")).to_be_visible()
+        expect(term).to_redraw_at_most(bytes=500)
+        assert term.redraws.since_input.full_clears == 1
+        assert term.redraws.total.full_clears == 2
+
+    def it_catches_full_screen_repaint_on_keypress(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("arrow_menu.py"), rows=24, cols=80, analyze_redraws=True)
+        expect(term.get_by_text("Select an option:")).to_be_visible()
+        term.key_down()
+        with pytest.raises(AssertionError, match="full clears > 0"):
+            expect(term).to_redraw_at_most(full_clears=0)
+
+    def it_measures_bytes_per_frame(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("table.py"), analyze_redraws=True)
+        expect(term).to_have_exited()
+        assert term.redraws.total.bytes == term.metrics.bytes_read
+        assert sum(term.redraws.histogram().values()) == term.redraws.total.frames
@@ -0,0 +1,58 @@
+"""Integration tests for child process resource sampling."""
+
+import pytest
+
+from curtaincall import expect, procfs
+
+pytestmark = pytest.mark.skipif(not procfs.is_available(), reason="requires /proc")
+
+
+def describe_resources():
+
+    def it_samples_child_memory(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("memory_hog.py") + " 40", sample_resources=0.05)
+        expect(term.get_by_text("Allocated 40 MB")).to_be_visible()
+        usage = term.resources
+        assert usage.samples >= 1
+        assert usage.peak_rss_mb >= 40
+        assert usage.peak_threads >= 1
+        assert usage.peak_fds >= 3
+
+    def it_keeps_usage_after_kill(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("memory_hog.py") + " 10", sample_resources=0.05)
+        expect(term.get_by_text("Allocated 10 MB")).to_be_visible()
+        term.kill()
+        assert term.resources.peak_rss_mb >= 10
+
+    def it_samples_on_demand(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("signal_handler.py"))
+        expect(term.get_by_text("Running")).to_be_visible()
+        assert term.resources.samples == 1
+
+
+def describe_memory_assertion():
+
+    def it_passes_under_limit(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("memory_hog.py") + " 5", sample_resources=0.05)
+        expect(term.get_by_text("Allocated 5 MB")).to_be_visible()
+        expect(term).to_use_less_memory_than(500)
+
+    def it_fails_over_limit(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("memory_hog.py") + " 60", sample_resources=0.05)
+        expect(term.get_by_text("Allocated 60 MB")).to_be_visible()
+        with pytest.raises(AssertionError, match="Expected peak memory below 50 MB"):
+            expect(term).to_use_less_memory_than(50)
+
+
+def describe_idle_cpu_assertion():
+
+    def it_passes_for_idle_process(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("signal_handler.py"))
+        expect(term.get_by_text("Running")).to_be_visible()
+        expect(term).to_be_idle_cpu(window=0.3)
+
+    def it_fails_for_busy_loop(terminal, fixture_cmd):
+        term = terminal(fixture_cmd("busy_loop.py"))
+        expect(term.get_by_text("Spinning")).to_be_visible()
+        with pytest.raises(AssertionError, match="Expected process to be idle"):
+            expect(term).to_be_idle_cpu(window=0.2, timeout=1.0)
@@ -0,0 +1,55 @@
+"""Integration tests for persistent shell sessions."""
+
+import shutil
+
+import pytest
+
+from curtaincall import expect
+
+
+@pytest.fixture(params=["bash", "zsh"])
+def shell(request, shell_session):
+    if shutil.which(request.param) is None:
+        pytest.skip(f"{request.param} is not installed")
+    return shell_session(request.param, rows=10, cols=60)
+
+
+def describe_shell_session():
+
+    def it_runs_commands_and_reports_exit_status(shell):
+        assert shell.run("true").exit_code == 0
+        assert shell.run("false").exit_code == 1
+        assert shell.run("(exit 42)").exit_code == 42
+
+    def it_captures_each_commands_output(shell):
+        first = shell.run("echo one; echo two")
+        second = shell.run("echo three")
+        assert first.output == "one\ntwo"
+        assert second.output == "three"
+        expect(second.get_by_text("three")).to_be_visible()
+        expect(second.get_by_text("one")).not_to_be_visible(timeout=0.1)
+
+    def it_keeps_state_between_commands(shell):
+        shell.run("export CC_SESSION=kept; cd /tmp")
+        assert shell.run("echo $CC_SESSION $PWD").output == "kept /tmp"
+
+    def it_runs_many_commands_in_one_process(shell):
+        pid = shell.pid
+        for i in range(50):
+            assert shell.run(f"echo {i}").output == str(i)
+        assert shell.pid == pid
+        assert shell.is_alive
+
+    def it_finds_output_scrolled_into_history(shell):
+        result = shell.run("seq 1 30")
+        assert result.output.splitlines()[0] == "1"
+        expect(result.get_by_text("30", full=True)).to_be_visible()
+        expect(result.get_by_text("1", full=True)).to_be_visible()
+
+    def it_times_out_on_long_commands(shell):
+        with pytest.raises(TimeoutError, match="did not finish"):
+            shell.run("sleep 5", timeout=0.3)
+
+    def it_reports_shell_exit(shell):
+        with pytest.raises(RuntimeError, match="exited with code 3"):
+            shell.run("exit 3")
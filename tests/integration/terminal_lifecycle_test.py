@@ -110,3 +110,30 @@ def describe_to_have_exited():
         expect(term.get_by_text("Running")).to_be_visible()
         with pytest.raises(AssertionError, match="Expected process to have exited"):
             expect(term).to_have_exited(timeout=0.5)
+
+
+# pexpect forks from a multi-threaded process (the native spawner does not)
+pexpect_fork_warning = pytest.mark.filterwarnings(
+    "ignore:This process .* is multi-threaded:DeprecationWarning"
+)
+
+
+@pexpect_fork_warning
+def describe_spawners():
+
+    @pytest.mark.parametrize("spawner", ["native", "pexpect"])
+    def it_runs_the_same_session_with_either_spawner(terminal, fixture_cmd, spawner):
+        term = terminal(fixture_cmd("echo.py"), spawner=spawner)
+        expect(term.get_by_text("ready>")).to_be_visible()
+        term.submit("ping")
+        expect(term.get_by_text("echo: ping")).to_be_visible()
+        assert term.metrics.spawn_time is not None
+
+    @pytest.mark.parametrize("spawner", ["native", "pexpect"])
+    def it_reports_exit_code_with_either_spawner(terminal, fixture_cmd, spawner):
+        term = terminal(fixture_cmd("exit_code.py") + " 7", spawner=spawner)
+        assert term.wait(timeout=5.0) == 7
+
+    def it_raises_when_command_is_missing(terminal):
+        with pytest.raises(FileNotFoundError, match="Command not found"):
+            terminal("definitely-not-a-real-command-xyz")